@@ -0,0 +1,52 @@
+import sys
+import time
+from pathlib import Path
+
+from aoc2025.day10 import Machine, read_file
+from utils.simplex import BranchAndBoundStats, NodeSelection, Simplex
+
+
+def build_simplex(machine: Machine) -> Simplex:
+    simplex = Simplex(tuple([-1] * len(machine.buttons)))
+    for i, requirement in enumerate(machine.joltages):
+        simplex.addEqConsraint([int(i in b) for b in machine.buttons], requirement)
+    return simplex
+
+
+def run_configuration(
+    machines: list[Machine], node_selection: NodeSelection, gomory_cuts: int
+) -> tuple[int, float, BranchAndBoundStats]:
+    total = BranchAndBoundStats()
+    presses = 0
+    start = time.perf_counter()
+    for machine in machines:
+        simplex = build_simplex(machine)
+        solve_result = simplex.solve_integer(node_selection=node_selection, gomory_cuts=gomory_cuts)
+        assert solve_result is not None
+        presses -= int(solve_result[0])
+
+        total.add_counts(simplex.stats)
+        total.root_time += simplex.stats.root_time
+        total.search_time += simplex.stats.search_time
+    return presses, time.perf_counter() - start, total
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Please provide the day 10 input file!", file=sys.stderr)
+        exit(-1)
+
+    machines = read_file(Path(sys.argv[1]))
+
+    print(
+        f"{'selection':<12} {'cuts':>4} {'presses':>8} {'nodes':>7} {'pruned':>7} {'infeas.':>7} "
+        f"{'incumb.':>7} {'pivots':>7} {'root s':>7} {'search s':>8} {'total s':>7}"
+    )
+    for node_selection in NodeSelection:
+        for gomory_cuts in (0, 4):
+            presses, elapsed, stats = run_configuration(machines, node_selection, gomory_cuts)
+            print(
+                f"{node_selection.name:<12} {gomory_cuts:>4} {presses:>8} {stats.nodes:>7} {stats.pruned:>7} "
+                f"{stats.infeasible:>7} {stats.incumbents:>7} {stats.pivots:>7} {stats.root_time:>7.3f} "
+                f"{stats.search_time:>8.3f} {elapsed:>7.3f}"
+            )
@@ -0,0 +1,83 @@
+import sys
+import time
+from pathlib import Path
+
+from aoc2025.day10 import Machine, read_file
+from utils.simplex import SimplexConstraint, SimplexConstraintType, SimplexTableau
+
+
+def build_tableau(machine: Machine) -> SimplexTableau:
+    profit = tuple([-1] * len(machine.buttons))
+    constraints = [
+        SimplexConstraint(SimplexConstraintType.EQ, tuple(int(i in b) for b in machine.buttons), requirement)
+        for i, requirement in enumerate(machine.joltages)
+    ]
+    return SimplexTableau(profit, constraints)
+
+
+def find_pivot(tableau: SimplexTableau) -> tuple[int, int] | None:
+    net_evaluation = tableau.net_evaluation
+    pivot_column = max(range(0, len(net_evaluation)), key=lambda i: net_evaluation[i])
+    if net_evaluation[pivot_column] <= 0:
+        return None
+
+    ratios = [
+        (row.rhs / row.lhs[pivot_column], i) for i, row in enumerate(tableau.rows) if row.lhs[pivot_column] > 0
+    ]
+    if not ratios:
+        return None
+    return min(ratios)[1], pivot_column
+
+
+def benchmark_machine(machine: Machine) -> tuple[int, float, float]:
+    # Per pivot: the time to read the maintained reduced costs and pivot, compared
+    # to the time a full zj recompute takes on the same tableau (the old cost).
+    tableau = build_tableau(machine)
+    pivots = 0
+    pivot_time = 0.0
+    recompute_time = 0.0
+
+    while True:
+        start = time.perf_counter()
+        pivot = find_pivot(tableau)
+        if pivot is not None:
+            tableau.pivot(*pivot)
+        pivot_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        zj = tableau.recompute_zj()
+        recompute_time += time.perf_counter() - start
+
+        assert zj == tableau.zj
+        if pivot is None:
+            if tableau.artificial_count == 0:
+                break
+            # End of phase I, the day 10 machines are always feasible
+            assert tableau.drop_artificials()
+            continue
+        pivots += 1
+
+    return pivots, pivot_time, recompute_time
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Please provide the day 10 input file!", file=sys.stderr)
+        exit(-1)
+
+    machines = read_file(Path(sys.argv[1]))
+
+    total_pivots = 0
+    total_pivot_time = 0.0
+    total_recompute_time = 0.0
+    for machine in machines:
+        pivots, pivot_time, recompute_time = benchmark_machine(machine)
+        total_pivots += pivots
+        total_pivot_time += pivot_time
+        total_recompute_time += recompute_time
+
+    iterations = total_pivots + len(machines)
+    print(f"Machines: {len(machines)}, pivots: {total_pivots}")
+    print(f"Pivot with maintained objective row: {1e6 * total_pivot_time / iterations:.1f} us per pivot")
+    print(f"Full zj recompute (previous cost):    {1e6 * total_recompute_time / iterations:.1f} us per pivot")
+    print(f"Speedup per pivot: {(total_pivot_time + total_recompute_time) / total_pivot_time:.1f}x")
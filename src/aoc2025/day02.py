@@ -1,6 +1,7 @@
 import cProfile
 import re
 import sys
+from collections.abc import Iterator
 
 
 def read_file(file_name: str) -> list[tuple[int, int]]:
@@ -84,6 +85,56 @@ def check_ids_2_regex(id_ranges: list[tuple[int, int]]) -> int:
     return result
 
 
+def digit_length_ranges(id1: int, id2: int) -> Iterator[tuple[int, int, int]]:
+    digits = len(str(id1))
+    while id1 <= id2:
+        upper = min(id2, 10**digits - 1)
+        yield digits, id1, upper
+        id1 = upper + 1
+        digits += 1
+
+
+def sum_repeated_blocks(id1: int, id2: int, digits: int, block_length: int) -> int:
+    # every id made of a block repeated k times equals block * (10^(k*L) - 1) / (10^L - 1)
+    multiplier = (10**digits - 1) // (10**block_length - 1)
+    block_min = max(10 ** (block_length - 1), -(-id1 // multiplier))
+    block_max = min(10**block_length - 1, id2 // multiplier)
+    if block_min > block_max:
+        return 0
+
+    return multiplier * (block_min + block_max) * (block_max - block_min + 1) // 2
+
+
+def check_ids_arithmetic(id_ranges: list[tuple[int, int]]) -> int:
+    result = 0
+
+    for id_range in id_ranges:
+        for digits, id1, id2 in digit_length_ranges(*id_range):
+            if digits % 2 == 0:
+                result += sum_repeated_blocks(id1, id2, digits, digits // 2)
+
+    return result
+
+
+def check_ids_2_arithmetic(id_ranges: list[tuple[int, int]]) -> int:
+    result = 0
+
+    for id_range in id_ranges:
+        for digits, id1, id2 in digit_length_ranges(*id_range):
+            block_lengths = [j for j in range(1, digits // 2 + 1) if digits % j == 0]
+
+            # inclusion-exclusion: a block length also covers all ids of its divisors,
+            # so only keep the ids whose shortest repeating block has exactly this length
+            exact_sums: dict[int, int] = {}
+            for j in block_lengths:
+                shorter = sum(exact_sums[k] for k in block_lengths if k < j and j % k == 0)
+                exact_sums[j] = sum_repeated_blocks(id1, id2, digits, j) - shorter
+
+            result += sum(exact_sums.values())
+
+    return result
+
+
 def profile_and_run(label, func, arg):
     profiler = cProfile.Profile()
     profiler.enable()
@@ -102,5 +153,7 @@ if __name__ == "__main__":
 
     profile_and_run("Phase 1", check_ids, input)
     profile_and_run("Phase 1 (regex)", check_ids_regex, input)
+    profile_and_run("Phase 1 (arithmetic)", check_ids_arithmetic, input)
     profile_and_run("Phase 2", check_ids_2, input)
     profile_and_run("Phase 2 (regex)", check_ids_2_regex, input)
+    profile_and_run("Phase 2 (arithmetic)", check_ids_2_arithmetic, input)
@@ -1,8 +1,29 @@
 import sys
+from collections.abc import Iterator
+from typing import NamedTuple
 
 Warehouse = list[list[bool]]
 
 
+class PackedWarehouse(NamedTuple):
+    # One byte per storage location, row-major, with a border of empty locations
+    # around the warehouse so neighbours never need a bounds check.
+    grid: bytearray
+    width: int
+    height: int
+
+    @property
+    def stride(self) -> int:
+        return self.width + 2
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def coordinates(self, idx: int) -> tuple[int, int]:
+        y, x = divmod(idx, self.stride)
+        return x - 1, y - 1
+
+
 def read_file(file_name: str) -> Warehouse:
     warehouse = []
     with open(file_name) as f:
@@ -52,7 +73,44 @@ def remove_paper(warehouse: Warehouse, spots: set[tuple[int, int]]):
         warehouse[y][x] = False
 
 
-def clean_up_warehouse(warehouse: Warehouse) -> int:
+def count_storage_neighbours(warehouse: Warehouse, x: int, y: int) -> int:
+    return sum(
+        check_storage_location_safe(warehouse, x + x_offset, y + y_offset)
+        for x_offset in [-1, 0, 1] for y_offset in [-1, 0, 1]
+        if not (x_offset == 0 and y_offset == 0)
+    )
+
+
+def clean_up_warehouse_rounds(warehouse: Warehouse) -> Iterator[int]:
+    neighbour_counts = {}
+    for y in range(0, len(warehouse)):
+        for x in range(0, len(warehouse[y])):
+            if warehouse[y][x]:
+                neighbour_counts[(x, y)] = count_storage_neighbours(warehouse, x, y)
+
+    removal_queue = [spot for spot, count in neighbour_counts.items() if count < 4]
+    while len(removal_queue) > 0:
+        remove_paper(warehouse, set(removal_queue))
+        yield len(removal_queue)
+
+        next_removal_queue = []
+        for x, y in removal_queue:
+            for x_offset in [-1, 0, 1]:
+                for y_offset in [-1, 0, 1]:
+                    neighbour = (x + x_offset, y + y_offset)
+                    if neighbour not in neighbour_counts or not warehouse[neighbour[1]][neighbour[0]]:
+                        continue
+
+                    neighbour_counts[neighbour] -= 1
+                    if neighbour_counts[neighbour] == 3:
+                        next_removal_queue.append(neighbour)
+        removal_queue = next_removal_queue
+
+
+def clean_up_warehouse(warehouse: Warehouse, incremental: bool = False) -> int:
+    if incremental:
+        return sum(clean_up_warehouse_rounds(warehouse))
+
     forkliftable_spots = find_forkliftable_spots(warehouse)
     papers_removed = len(forkliftable_spots)
 
@@ -64,6 +122,100 @@ def clean_up_warehouse(warehouse: Warehouse) -> int:
     return papers_removed
 
 
+def pack_warehouse(warehouse: Warehouse) -> PackedWarehouse:
+    height = len(warehouse)
+    width = max((len(row) for row in warehouse), default=0)
+    stride = width + 2
+
+    grid = bytearray(stride * (height + 2))
+    for y, row in enumerate(warehouse):
+        start = (y + 1) * stride + 1
+        grid[start:start + len(row)] = bytes(row)
+
+    return PackedWarehouse(grid, width, height)
+
+
+def read_file_packed(file_name: str) -> PackedWarehouse:
+    with open(file_name, "rb") as f:
+        lines = f.read().splitlines()
+
+    height = len(lines)
+    width = max((len(line) for line in lines), default=0)
+    stride = width + 2
+
+    grid = bytearray(stride * (height + 2))
+    to_bits = bytes.maketrans(b"@.", b"\x01\x00")
+    for y, line in enumerate(lines):
+        start = (y + 1) * stride + 1
+        grid[start:start + len(line)] = line.translate(to_bits)
+
+    return PackedWarehouse(grid, width, height)
+
+
+def count_neighbours(packed: PackedWarehouse) -> bytearray:
+    # Every location holds 0 or 1 and has at most 8 neighbours, so adding byte
+    # shifted copies of the whole grid as one big integer never carries between
+    # locations. This computes the 8-neighbour convolution in a single batch.
+    stride = packed.stride
+    offsets = [dy * stride + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx != 0 or dy != 0]
+    margin = stride + 1
+
+    cells = int.from_bytes(packed.grid, "little")
+    total = 0
+    for offset in offsets:
+        total += cells << (8 * (margin - offset))
+
+    size = len(packed.grid)
+    return bytearray(total.to_bytes(size + 2 * margin, "little")[margin:margin + size])
+
+
+def find_forkliftable_indices(packed: PackedWarehouse, counts: bytearray) -> list[int]:
+    grid = packed.grid
+    return [i for i, count in enumerate(counts) if count < 4 and grid[i]]
+
+
+def find_forkliftable_spots_packed(packed: PackedWarehouse) -> set[tuple[int, int]]:
+    counts = count_neighbours(packed)
+    return {packed.coordinates(i) for i in find_forkliftable_indices(packed, counts)}
+
+
+def clean_up_packed_warehouse(packed: PackedWarehouse) -> int:
+    grid = packed.grid
+    stride = packed.stride
+    offsets = [dy * stride + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx != 0 or dy != 0]
+
+    counts = count_neighbours(packed)
+    worklist = find_forkliftable_indices(packed, counts)
+    for i in worklist:
+        grid[i] = 0
+
+    papers_removed = 0
+    while worklist:
+        papers_removed += len(worklist)
+
+        next_worklist = []
+        for i in worklist:
+            for offset in offsets:
+                neighbour = i + offset
+                counts[neighbour] -= 1
+                if grid[neighbour] and counts[neighbour] < 4:
+                    grid[neighbour] = 0
+                    next_worklist.append(neighbour)
+        worklist = next_worklist
+
+    return papers_removed
+
+
+def unpack_warehouse(packed: PackedWarehouse) -> Warehouse:
+    stride = packed.stride
+    warehouse = []
+    for y in range(0, packed.height):
+        start = (y + 1) * stride + 1
+        warehouse.append([bool(c) for c in packed.grid[start:start + packed.width]])
+
+    return warehouse
+
+
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print("Please provide the input file!", file=sys.stderr)
@@ -1,6 +1,11 @@
 import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import NamedTuple, NewType
+from typing import NamedTuple, NewType, TextIO
+
+from utils.intervalset import IntervalSet
 
 
 class FreshIdRange(NamedTuple):
@@ -30,6 +35,25 @@ def read_file(file_name: Path) -> tuple[list[FreshIdRange], list[Ingredient]]:
     return fresh_id_ranges, ingredients
 
 
+def read_fresh_id_ranges(f: TextIO) -> list[FreshIdRange]:
+    fresh_id_ranges = []
+    for line in f:
+        line = line.strip()
+        if line == "":
+            break
+        id1, id2 = line.split("-")
+        fresh_id_ranges.append(FreshIdRange(int(id1), int(id2)))
+
+    return fresh_id_ranges
+
+
+def stream_ingredients(f: TextIO) -> Iterator[Ingredient]:
+    for line in f:
+        line = line.strip()
+        if line != "":
+            yield Ingredient(int(line))
+
+
 def optimize_fresh_id_ranges(fresh_id_ranges: list[FreshIdRange]) -> list[FreshIdRange]:
     if len(fresh_id_ranges) == 0:
         return []
@@ -70,7 +94,14 @@ def count_available_fresh_ingredients(fresh_id_ranges: list[FreshIdRange], ingre
     return len(fresh_ingredients)
 
 
-def count_all_fresh_ingredients(fresh_id_ranges: list[FreshIdRange]) -> int:
+def build_fresh_id_set(fresh_id_ranges: list[FreshIdRange]) -> IntervalSet:
+    return IntervalSet([(id_range.start, id_range.end) for id_range in fresh_id_ranges])
+
+
+def count_all_fresh_ingredients(fresh_id_ranges: list[FreshIdRange] | IntervalSet) -> int:
+    if isinstance(fresh_id_ranges, IntervalSet):
+        return fresh_id_ranges.total
+
     result = 0
     for id_range in fresh_id_ranges:
         result += id_range.end - id_range.start + 1
@@ -78,13 +109,60 @@ def count_all_fresh_ingredients(fresh_id_ranges: list[FreshIdRange]) -> int:
     return result
 
 
+class FreshIdIndex:
+    def __init__(self, fresh_id_ranges: list[FreshIdRange]) -> None:
+        optimized_fresh_id_ranges = optimize_fresh_id_ranges(fresh_id_ranges)
+        self.__starts: array[int] = array("q", (id_range.start for id_range in optimized_fresh_id_ranges))
+        self.__ends: array[int] = array("q", (id_range.end for id_range in optimized_fresh_id_ranges))
+
+    def __len__(self) -> int:
+        return len(self.__starts)
+
+    def __contains__(self, ingredient: Ingredient) -> bool:
+        idx = bisect_right(self.__starts, ingredient) - 1
+        return idx >= 0 and ingredient <= self.__ends[idx]
+
+    def ranges(self) -> list[FreshIdRange]:
+        return [FreshIdRange(start, end) for start, end in zip(self.__starts, self.__ends)]
+
+    def count_fresh(self, ingredients: Iterable[Ingredient]) -> int:
+        return sum(1 for ingredient in ingredients if ingredient in self)
+
+    def count_fresh_sorted(self, ingredients: Iterable[Ingredient]) -> int:
+        # Merge join: both the ranges and the ingredients are ascending, so each
+        # range is passed at most once over the whole stream.
+        starts = self.__starts
+        ends = self.__ends
+        range_count = len(starts)
+
+        result = 0
+        idx = 0
+        for ingredient in ingredients:
+            while idx < range_count and ends[idx] < ingredient:
+                idx += 1
+            if idx == range_count:
+                break
+            if starts[idx] <= ingredient:
+                result += 1
+
+        return result
+
+    def count_all_fresh(self) -> int:
+        return sum(self.__ends) - sum(self.__starts) + len(self.__starts)
+
+
+def count_available_fresh_ingredients_streaming(file_name: Path) -> tuple[FreshIdIndex, int]:
+    with open(file_name) as f:
+        fresh_id_index = FreshIdIndex(read_fresh_id_ranges(f))
+        return fresh_id_index, fresh_id_index.count_fresh(stream_ingredients(f))
+
+
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print("Please provide the input file!", file=sys.stderr)
         exit(-1)
 
-    fresh_id_ranges, ingredients = read_file(Path(sys.argv[1]))
-    fresh_id_ranges = optimize_fresh_id_ranges(fresh_id_ranges)
+    fresh_id_index, fresh_ingredients_count = count_available_fresh_ingredients_streaming(Path(sys.argv[1]))
 
-    print("Phase 1:", count_available_fresh_ingredients(fresh_id_ranges, ingredients))
-    print("Phase 2:", count_all_fresh_ingredients(fresh_id_ranges))
+    print("Phase 1:", fresh_ingredients_count)
+    print("Phase 2:", fresh_id_index.count_all_fresh())
@@ -1,12 +1,26 @@
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import NamedTuple
+from typing import BinaryIO, NamedTuple
 
 class Problem(NamedTuple):
     operator: str
     numbers: list[int]
 
 
+class Worksheet(NamedTuple):
+    # Row-major cells, every row padded with spaces to the same width.
+    # The last row holds the operators.
+    cells: bytearray
+    width: int
+    height: int
+
+
+SPACE = ord(" ")
+PLUS = ord("+")
+ZERO = ord("0")
+
+
 def read_file(file_name: Path) -> list[str]:
     result = []
     with open(file_name) as f:
@@ -15,57 +29,165 @@ def read_file(file_name: Path) -> list[str]:
     return result
 
 
-def parse_worksheet_phase1(content: list[str]) -> list[Problem]:
+def pack_worksheet(lines: list[bytes]) -> Worksheet:
+    width = max((len(line) for line in lines), default=0)
+    cells = bytearray()
+    for line in lines:
+        cells += line.ljust(width)
+    return Worksheet(cells, width, len(lines))
+
+
+def read_worksheet(file_name: Path) -> Worksheet:
+    with open(file_name, "rb") as f:
+        return pack_worksheet(f.read().splitlines())
+
+
+def generate_problems_phase1(content: list[str]) -> Iterator[Problem]:
     columns = []
     for line in content:
         columns.append(line.split())
 
-    problems = []
     for i in range(0, len(columns[0])):
         operator = columns[-1][i]
         numbers = [int(columns[j][i]) for j in range(0, len(columns) - 1)]
-        problems.append(Problem(operator, numbers))
-    return problems
+        yield Problem(operator, numbers)
 
 
-def parse_worksheet_phase2(content: list[str]) -> list[Problem]:
-    operators = content[-1].split()
+def parse_worksheet_phase1(content: list[str]) -> list[Problem]:
+    return list(generate_problems_phase1(content))
 
-    transposed_content = []
-    for j in range(0, len(content[0])):
-        number_str = ""
-        for i in range(0, len(content) - 1):
-            number_str += content[i][j]
-        transposed_content.append(number_str)
+
+def generate_problems_phase2(content: list[str]) -> Iterator[Problem]:
+    operators = content[-1].split()
 
     current_operator = 0
     current_numbers = []
-    problems = []
-    for line in transposed_content:
-        if line.strip() == "":
-            problems.append(Problem(operators[current_operator], current_numbers))
+    for j in range(0, len(content[0])):
+        number_str = "".join(content[i][j] for i in range(0, len(content) - 1))
+        if number_str.strip() == "":
+            yield Problem(operators[current_operator], current_numbers)
             current_operator += 1
             current_numbers = []
         else:
-            current_numbers.append(int(line))
-    problems.append(Problem(operators[current_operator], current_numbers))
+            current_numbers.append(int(number_str))
+    yield Problem(operators[current_operator], current_numbers)
 
-    return problems
+
+def parse_worksheet_phase2(content: list[str]) -> list[Problem]:
+    return list(generate_problems_phase2(content))
 
 
-def product(factors: list[int]) -> int:
+def product(factors: Iterable[int]) -> int:
     result = 1
     for i in factors:
         result *= i
     return result
 
 
-def calculate_problems(problems: list[Problem]) -> list[int]:
-    result = []
+def evaluate_problems(problems: Iterable[Problem]) -> Iterator[int]:
     for problem in problems:
         problem_function = sum if problem.operator == "+" else product
-        result.append(problem_function(problem.numbers))
-    return result
+        yield problem_function(problem.numbers)
+
+
+def calculate_problems(problems: list[Problem]) -> list[int]:
+    return list(evaluate_problems(problems))
+
+
+def generate_worksheet_blocks(f: BinaryIO, block_width: int = 1 << 16) -> Iterator[Worksheet]:
+    # Only the offset and length of every row is kept, the cells are read back
+    # one block of columns at a time. The file object has to be seekable.
+    row_starts = []
+    row_lengths = []
+    row_start = 0
+    position = 0
+    while chunk := f.read(1 << 20):
+        newline = chunk.find(b"\n")
+        while newline >= 0:
+            row_starts.append(row_start)
+            row_lengths.append(position + newline - row_start)
+            row_start = position + newline + 1
+            newline = chunk.find(b"\n", newline + 1)
+        position += len(chunk)
+    if position > row_start:
+        row_starts.append(row_start)
+        row_lengths.append(position - row_start)
+
+    width = max(row_lengths, default=0)
+    for block_start in range(0, width, block_width):
+        block_end = min(block_start + block_width, width)
+        lines = []
+        for row_start, row_length in zip(row_starts, row_lengths):
+            line = b""
+            if block_start < row_length:
+                f.seek(row_start + block_start)
+                line = f.read(min(block_end, row_length) - block_start).replace(b"\r", b" ")
+            lines.append(line.ljust(block_end - block_start))
+        yield pack_worksheet(lines)
+
+
+def evaluate_worksheet_blocks(worksheets: Iterable[Worksheet]) -> Iterator[tuple[int, int]]:
+    # Walks the columns once and solves both layouts at the same time:
+    # phase 1 collects one number per row, phase 2 reads each column as a number.
+    # A problem may continue from one block into the next.
+    operator = None
+    row_numbers: list[int] = []
+    column_result = 0
+
+    for worksheet in worksheets:
+        cells = memoryview(worksheet.cells)
+        width = worksheet.width
+        row_offsets = range(0, (worksheet.height - 1) * width, width)
+        operator_offset = (worksheet.height - 1) * width
+
+        for j in range(0, width):
+            column_number = -1
+            for offset in row_offsets:
+                c = cells[offset + j]
+                if c != SPACE:
+                    column_number = max(column_number, 0) * 10 + c - ZERO
+
+            if column_number < 0:
+                # Separator column closes the current problem.
+                if operator is not None:
+                    yield sum(row_numbers) if operator == PLUS else product(row_numbers), column_result
+                    operator = None
+                continue
+
+            if operator is None:
+                operator = cells[operator_offset + j]
+                row_numbers = [0] * len(row_offsets)
+                column_result = 0 if operator == PLUS else 1
+
+            for i, offset in enumerate(row_offsets):
+                c = cells[offset + j]
+                if c != SPACE:
+                    row_numbers[i] = row_numbers[i] * 10 + c - ZERO
+
+            if operator == PLUS:
+                column_result += column_number
+            else:
+                column_result *= column_number
+
+    if operator is not None:
+        yield sum(row_numbers) if operator == PLUS else product(row_numbers), column_result
+
+
+def accumulate_results(results: Iterable[tuple[int, int]]) -> tuple[int, int]:
+    total1 = 0
+    total2 = 0
+    for result1, result2 in results:
+        total1 += result1
+        total2 += result2
+    return total1, total2
+
+
+def calculate_worksheet(worksheet: Worksheet) -> tuple[int, int]:
+    return accumulate_results(evaluate_worksheet_blocks([worksheet]))
+
+
+def calculate_worksheet_stream(f: BinaryIO, block_width: int = 1 << 16) -> tuple[int, int]:
+    return accumulate_results(evaluate_worksheet_blocks(generate_worksheet_blocks(f, block_width)))
 
 
 if __name__ == "__main__":
@@ -73,12 +195,8 @@ if __name__ == "__main__":
         print("Please provide the input file!", file=sys.stderr)
         exit(-1)
 
-    content = read_file(Path(sys.argv[1]))
-
-    problems1 = parse_worksheet_phase1(content)
-    answers1 = calculate_problems(problems1)
-    print("Phase 1:", sum(answers1))
+    with open(Path(sys.argv[1]), "rb") as f:
+        total1, total2 = calculate_worksheet_stream(f)
 
-    problems2 = parse_worksheet_phase2(content)
-    answers2 = calculate_problems(problems2)
-    print("Phase 2:", sum(answers2))
+    print("Phase 1:", total1)
+    print("Phase 2:", total2)
@@ -1,5 +1,6 @@
 import sys
 import copy
+from collections.abc import Iterable
 from pathlib import Path
 from typing import NewType
 
@@ -115,15 +116,51 @@ def print_manifold(manifold: Manifold):
         print()
 
 
+def trace_timelines(lines: Iterable[str]) -> tuple[int, int]:
+    # Only keeps the timeline count per column of the current row, the full
+    # manifold model is just needed for debugging with print_manifold.
+    timelines: list[int] = []
+    split_count = 0
+    for line in lines:
+        line = line.rstrip("\n")
+        if len(timelines) < len(line):
+            timelines.extend([0] * (len(line) - len(timelines)))
+
+        hits = []
+        j = line.find("^")
+        while j >= 0:
+            if timelines[j] > 0:
+                hits.append((j, timelines[j]))
+            j = line.find("^", j + 1)
+
+        for j, _ in hits:
+            timelines[j] = 0
+        for j, count in hits:
+            split_count += 1
+            if j > 0:
+                timelines[j - 1] += count
+            if j + 1 < len(timelines):
+                timelines[j + 1] += count
+
+        j = line.find("S")
+        while j >= 0:
+            timelines[j] += 1
+            j = line.find("S", j + 1)
+
+    return split_count, sum(timelines)
+
+
+def trace_timelines_file(file_name: Path) -> tuple[int, int]:
+    with open(file_name) as f:
+        return trace_timelines(f)
+
+
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print("Please provide the input file!", file=sys.stderr)
         exit(-1)
 
-    manifold = read_file(Path(sys.argv[1]))
-
-    _, x = beam_tracer(manifold)
-    print("Phase 1:", x)
+    split_count, timelines_count = trace_timelines_file(Path(sys.argv[1]))
 
-    quatum_manifold, timelines_count = quantum_beam_tracer(manifold)
+    print("Phase 1:", split_count)
     print("Phase 2:", timelines_count)
@@ -1,9 +1,18 @@
 import sys
+import heapq
+from bisect import insort
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from math import sqrt
 from pathlib import Path
 from typing import NamedTuple
 
-from utils.disjointset import DisjointSet
+from utils.disjointset import DisjointSet, IntDisjointSet
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
 
 
 class JunctionBox(NamedTuple):
@@ -42,16 +51,392 @@ def calculate_distances(junction_boxes: list[JunctionBox]) -> list[Connection]:
     return distances
 
 
+def squared_distance(junction_box1: JunctionBox, junction_box2: JunctionBox) -> int:
+    x_diff = (junction_box1.x - junction_box2.x) ** 2
+    y_diff = (junction_box1.y - junction_box2.y) ** 2
+    z_diff = (junction_box1.z - junction_box2.z) ** 2
+    return x_diff + y_diff + z_diff
+
+
+class JunctionBoxTree:
+    # Static k-d tree over the box indices for nearest neighbour queries, either of
+    # the next pairs of a box or of the nearest box outside of its circuit. Subtrees
+    # that only hold boxes of one circuit are marked by set_circuits(), so a circuit
+    # query never descends into its own.
+    def __init__(self, junction_boxes: list[JunctionBox], leaf_size: int = 8) -> None:
+        self.__junction_boxes: list[JunctionBox] = junction_boxes
+        self.__leaf_size: int = leaf_size
+        self.__order: list[int] = list(range(0, len(junction_boxes)))
+        self.__bounds: list[tuple[JunctionBox, JunctionBox]] = []
+        self.__ranges: list[tuple[int, int]] = []
+        self.__children: list[tuple[int, int]] = []
+        self.__node_circuits: list[int] = []
+        self.__circuits: list[int] = [0] * len(junction_boxes)
+        self.__distance_evaluations: int = 0
+        if junction_boxes:
+            self.__build(0, len(junction_boxes))
+
+    @property
+    def distance_evaluations(self) -> int:
+        return self.__distance_evaluations
+
+    def __build(self, start: int, end: int) -> int:
+        members = [self.__junction_boxes[i] for i in self.__order[start:end]]
+        low = JunctionBox(*(min(b[axis] for b in members) for axis in range(0, 3)))
+        high = JunctionBox(*(max(b[axis] for b in members) for axis in range(0, 3)))
+
+        node = len(self.__ranges)
+        self.__bounds.append((low, high))
+        self.__ranges.append((start, end))
+        self.__children.append((-1, -1))
+        self.__node_circuits.append(-1)
+
+        if end - start > self.__leaf_size:
+            axis = max(range(0, 3), key=lambda a: high[a] - low[a])
+            self.__order[start:end] = sorted(self.__order[start:end], key=lambda i: self.__junction_boxes[i][axis])
+            middle = (start + end) // 2
+            left = self.__build(start, middle)
+            right = self.__build(middle, end)
+            self.__children[node] = (left, right)
+        return node
+
+    def set_circuits(self, circuits: list[int]) -> None:
+        self.__circuits = circuits
+        # Children always have higher node numbers, so walk backwards
+        for node in range(len(self.__ranges) - 1, -1, -1):
+            left, right = self.__children[node]
+            if left < 0:
+                start, end = self.__ranges[node]
+                first = circuits[self.__order[start]]
+                uniform = all(circuits[i] == first for i in self.__order[start:end])
+                self.__node_circuits[node] = first if uniform else -1
+            elif self.__node_circuits[left] == self.__node_circuits[right]:
+                self.__node_circuits[node] = self.__node_circuits[left]
+            else:
+                self.__node_circuits[node] = -1
+
+    def __bound_distance(self, junction_box: JunctionBox, node: int) -> int:
+        low, high = self.__bounds[node]
+        distance = 0
+        for axis in range(0, 3):
+            if junction_box[axis] < low[axis]:
+                distance += (low[axis] - junction_box[axis]) ** 2
+            elif junction_box[axis] > high[axis]:
+                distance += (junction_box[axis] - high[axis]) ** 2
+        return distance
+
+    def nearest_pairs(
+        self, i: int, k: int, after: tuple[int, JunctionBox, JunctionBox] | None = None
+    ) -> list[tuple[tuple[int, JunctionBox, JunctionBox], int]]:
+        # The k pairs of box i with the boxes j > i that sort first after the
+        # given key, as (key, j) in the order of sorting the connections.
+        junction_boxes = self.__junction_boxes
+        junction_box = junction_boxes[i]
+
+        best: list[tuple[tuple[int, JunctionBox, JunctionBox], int]] = []
+        stack = [0] if self.__ranges and k > 0 else []
+        while stack:
+            node = stack.pop()
+            if len(best) == k and self.__bound_distance(junction_box, node) > best[-1][0][0]:
+                continue
+
+            left, right = self.__children[node]
+            if left >= 0:
+                # Visit the nearer child first
+                if self.__bound_distance(junction_box, left) <= self.__bound_distance(junction_box, right):
+                    stack.extend((right, left))
+                else:
+                    stack.extend((left, right))
+                continue
+
+            start, end = self.__ranges[node]
+            for j in self.__order[start:end]:
+                if j <= i:
+                    continue
+                self.__distance_evaluations += 1
+                key = (squared_distance(junction_box, junction_boxes[j]), junction_box, junction_boxes[j])
+                if after is not None and key <= after:
+                    continue
+                if len(best) < k or key < best[-1][0]:
+                    insort(best, (key, j))
+                    del best[k:]
+
+        return best
+
+    def nearest_outside_circuit(
+        self, i: int, bound: tuple[int, JunctionBox, JunctionBox] | None = None
+    ) -> tuple[int, int] | None:
+        # (squared distance, j) of the nearest box in another circuit, ties are
+        # broken like sorting the connections, by the boxes of the pair. Only
+        # pairs that sort before bound are considered, None if there is none.
+        junction_boxes = self.__junction_boxes
+        junction_box = junction_boxes[i]
+        circuit = self.__circuits[i]
+
+        best = bound
+        best_j = -1
+        stack = [0] if self.__ranges else []
+        while stack:
+            node = stack.pop()
+            if self.__node_circuits[node] == circuit:
+                continue
+            if best is not None and self.__bound_distance(junction_box, node) > best[0]:
+                continue
+
+            left, right = self.__children[node]
+            if left >= 0:
+                # Visit the nearer child first
+                if self.__bound_distance(junction_box, left) <= self.__bound_distance(junction_box, right):
+                    stack.extend((right, left))
+                else:
+                    stack.extend((left, right))
+                continue
+
+            start, end = self.__ranges[node]
+            for j in self.__order[start:end]:
+                if self.__circuits[j] == circuit:
+                    continue
+                self.__distance_evaluations += 1
+                key = (squared_distance(junction_box, junction_boxes[j]),) + (
+                    (junction_box, junction_boxes[j]) if i < j else (junction_boxes[j], junction_box)
+                )
+                if best is None or key < best:
+                    best = key
+                    best_j = j
+
+        return (best[0], best_j) if best is not None and best_j >= 0 else None
+
+
+def generate_nearest_pairs(
+    junction_boxes: list[JunctionBox], tree: JunctionBoxTree | None = None
+) -> Iterator[tuple[int, int, int]]:
+    # Yields (squared distance, i, j) with i < j in the same order as sorting all
+    # connections. Every box hands out its pairs with the boxes after it from the
+    # tree in batches that double in size, merged by a heap holding one pair per
+    # box, so only one batch per box is materialised beyond the pairs yielded.
+    if tree is None:
+        tree = JunctionBoxTree(junction_boxes)
+
+    batch_sizes = [2] * len(junction_boxes)
+    batches: list[list[tuple[tuple[int, JunctionBox, JunctionBox], int]]] = []
+    heap = []
+    for i in range(0, len(junction_boxes)):
+        batch = tree.nearest_pairs(i, batch_sizes[i])
+        if len(batch) < batch_sizes[i]:
+            batch_sizes[i] = 0
+        batch.reverse()
+        batches.append(batch)
+        if batch:
+            key, j = batch.pop()
+            heap.append((key, i, j))
+    heapq.heapify(heap)
+
+    while heap:
+        key, i, j = heapq.heappop(heap)
+        yield key[0], i, j
+
+        batch = batches[i]
+        if not batch and batch_sizes[i] > 0:
+            batch = tree.nearest_pairs(i, batch_sizes[i] * 2, key)
+            # A batch that is not full was the last one of this box
+            batch_sizes[i] = batch_sizes[i] * 2 if len(batch) == batch_sizes[i] * 2 else 0
+            batch.reverse()
+            batches[i] = batch
+        if batch:
+            next_key, next_j = batch.pop()
+            heapq.heappush(heap, (next_key, i, next_j))
+
+
+def to_connection(junction_boxes: list[JunctionBox], pair: tuple[int, int, int]) -> Connection:
+    distance, i, j = pair
+    return Connection(distance=sqrt(distance), junction_box_1=junction_boxes[i], junction_box_2=junction_boxes[j])
+
+
+def make_shortest_connections_spatial(
+    junction_boxes: list[JunctionBox], n: int
+) -> tuple[DisjointSet[JunctionBox], list[Connection]]:
+    disjoint_set = DisjointSet[JunctionBox]()
+
+    results = []
+    for pair in islice(generate_nearest_pairs(junction_boxes), n):
+        candidate = to_connection(junction_boxes, pair)
+        disjoint_set.union(candidate.junction_box_1, candidate.junction_box_2)
+        results.append(candidate)
+
+    return disjoint_set, results
+
+
+def find_spanning_pairs(
+    junction_boxes: list[JunctionBox], tree: JunctionBoxTree | None = None
+) -> list[tuple[int, int, int]]:
+    # Borůvka: every round joins each circuit to its nearest box outside of it.
+    # A box only queries the tree again once its cached nearest box joined its
+    # circuit, since the boxes outside of a circuit only ever become fewer, and
+    # the query is bounded by the cheapest pair its circuit has found so far.
+    # Returns (squared distance, i, j) with i < j in the order Kruskal adds them.
+    if tree is None:
+        tree = JunctionBoxTree(junction_boxes)
+
+    circuits = IntDisjointSet(len(junction_boxes))
+    nearest: list[tuple[int, int] | None] = [None] * len(junction_boxes)
+    pairs: list[tuple[int, int, int]] = []
+    while circuits.component_count > 1:
+        labels = [circuits.find(i) for i in range(0, len(junction_boxes))]
+        tree.set_circuits(labels)
+
+        cheapest: dict[int, tuple[tuple[int, JunctionBox, JunctionBox], int, int]] = {}
+        for i in range(0, len(junction_boxes)):
+            current = cheapest.get(labels[i])
+            candidate = nearest[i]
+            if candidate is None or labels[candidate[1]] == labels[i]:
+                # Without a cached box the bound may hide the nearest one, so it is queried again next round
+                candidate = tree.nearest_outside_circuit(i, current[0] if current is not None else None)
+                nearest[i] = candidate
+                if candidate is None:
+                    continue
+
+            distance, j = candidate
+            i_low, j_high = min(i, j), max(i, j)
+            key = (distance, junction_boxes[i_low], junction_boxes[j_high])
+            if current is None or key < current[0]:
+                cheapest[labels[i]] = (key, i_low, j_high)
+
+        for key, i, j in cheapest.values():
+            # Two circuits can pick the same pair
+            if circuits.find(i) != circuits.find(j):
+                circuits.union(i, j)
+                pairs.append((key[0], i, j))
+
+    pairs.sort(key=lambda x: (x[0], junction_boxes[x[1]], junction_boxes[x[2]]))
+    return pairs
+
+
+def find_spanning_tree_spatial(
+    junction_boxes: list[JunctionBox],
+) -> tuple[DisjointSet[JunctionBox], list[Connection]]:
+    disjoint_set = DisjointSet[JunctionBox]()
+
+    results = []
+    for pair in find_spanning_pairs(junction_boxes):
+        _, i, j = pair
+        disjoint_set.union(junction_boxes[i], junction_boxes[j])
+        results.append(to_connection(junction_boxes, pair))
+
+    return disjoint_set, results
+
+
+def find_nearest_pairs_numpy(
+    junction_boxes: list[JunctionBox], k: int, block_size: int | None = None
+) -> list[tuple[int, int, int]]:
+    # Computes the squared distances one block of rows at a time and only keeps
+    # the k smallest pairs seen so far (plus ties with the k-th one, so the order
+    # matches sorting all connections), so memory stays at O(block_size * n + k).
+    if np is None:
+        raise ImportError("find_nearest_pairs_numpy requires numpy")
+
+    n = len(junction_boxes)
+    if k <= 0 or n < 2:
+        return []
+
+    coordinates = np.array(junction_boxes, dtype=np.int64).reshape(n, 3)
+    if block_size is None:
+        block_size = max(1, (1 << 22) // n)
+
+    unused = np.iinfo(np.int64).max
+    best_distances = np.empty(0, dtype=np.int64)
+    best_pairs = np.empty(0, dtype=np.int64)
+    for block_start in range(0, n - 1, block_size):
+        block_end = min(block_start + block_size, n - 1)
+        block = coordinates[block_start:block_end]
+        others = coordinates[block_start + 1:]
+
+        distances = np.zeros((len(block), len(others)), dtype=np.int64)
+        for axis in range(0, 3):
+            diff = block[:, axis, None] - others[None, :, axis]
+            distances += diff * diff
+
+        # others[c] is box block_start + 1 + c, only pairs with j > i are kept
+        distances[np.tri(len(block), len(others), -1, dtype=bool)] = unused
+        distances = distances.ravel()
+
+        candidates = select_smallest(distances, k)
+        candidates = candidates[distances[candidates] != unused]
+        rows, columns = np.divmod(candidates, len(others))
+
+        best_distances = np.concatenate((best_distances, distances[candidates]))
+        best_pairs = np.concatenate((best_pairs, (rows + block_start) * n + columns + block_start + 1))
+
+        keep = select_smallest(best_distances, k)
+        best_distances = best_distances[keep]
+        best_pairs = best_pairs[keep]
+
+    best_i, best_j = np.divmod(best_pairs, n)
+    pairs = list(zip(best_distances.tolist(), best_i.tolist(), best_j.tolist()))
+    pairs.sort(key=lambda x: (x[0], junction_boxes[x[1]], junction_boxes[x[2]]))
+    return pairs[:k]
+
+
+def select_smallest(values: "np.ndarray", k: int) -> "np.ndarray":
+    # Indices of the k smallest values and of everything tied with the k-th one.
+    if len(values) <= k:
+        return np.arange(len(values))
+    kth = np.partition(values, k - 1)[k - 1]
+    return np.flatnonzero(values <= kth)
+
+
+def make_shortest_connections_numpy(
+    junction_boxes: list[JunctionBox], n: int
+) -> tuple[DisjointSet[JunctionBox], list[Connection]]:
+    disjoint_set = DisjointSet[JunctionBox]()
+
+    results = []
+    for pair in find_nearest_pairs_numpy(junction_boxes, n):
+        candidate = to_connection(junction_boxes, pair)
+        disjoint_set.union(candidate.junction_box_1, candidate.junction_box_2)
+        results.append(candidate)
+
+    return disjoint_set, results
+
+
+class SortedConnections:
+    # Hands out connections in ascending order on demand. The heap is only popped
+    # as far as a consumer reads, and everything popped is kept, so all consumers
+    # share one partial sort.
+    def __init__(self, connections: Iterable[Connection]) -> None:
+        self.__heap: list[Connection] = list(connections)
+        heapq.heapify(self.__heap)
+        self.__sorted: list[Connection] = []
+
+    def __len__(self) -> int:
+        return len(self.__sorted) + len(self.__heap)
+
+    def __ensure_sorted(self, n: int) -> bool:
+        while len(self.__sorted) < n and self.__heap:
+            self.__sorted.append(heapq.heappop(self.__heap))
+        return len(self.__sorted) >= n
+
+    def __getitem__(self, idx: int) -> Connection:
+        if idx < 0 or not self.__ensure_sorted(idx + 1):
+            raise IndexError("connection index out of range")
+        return self.__sorted[idx]
+
+    def __iter__(self) -> Iterator[Connection]:
+        idx = 0
+        while self.__ensure_sorted(idx + 1):
+            yield self.__sorted[idx]
+            idx += 1
+
+
 def make_shortest_connections(
-    connections: list[Connection], n: int
+    connections: list[Connection] | SortedConnections, n: int
 ) -> tuple[DisjointSet[JunctionBox], list[Connection]]:
     disjoint_set = DisjointSet[JunctionBox]()
 
     results = []
-    connections = sorted(connections)
+    if not isinstance(connections, SortedConnections):
+        connections = SortedConnections(connections)
 
-    for i in range(0, n):
-        candidate = connections[i]
+    for candidate in islice(connections, n):
         junction_box1 = candidate[1]
         junction_box2 = candidate[2]
 
@@ -62,12 +447,14 @@ def make_shortest_connections(
 
 
 def find_spanning_tree(
-    junction_boxes: list[JunctionBox], connections: list[Connection]
+    junction_boxes: list[JunctionBox], connections: list[Connection] | SortedConnections
 ) -> tuple[DisjointSet[JunctionBox], list[Connection]]:
     disjoint_set = DisjointSet()
 
     results = []
-    connections = sorted(connections)
+    if not isinstance(connections, SortedConnections):
+        connections = SortedConnections(connections)
+
     for candidate in connections:
         junction_box1 = candidate[1]
         junction_box2 = candidate[2]
@@ -88,7 +475,7 @@ def find_spanning_tree(
 
 
 def count_circuit_sizes(circuits: DisjointSet, n: int = 3):
-    largest_circuits = sorted((x[1] for x in circuits.values()), reverse=True)[:n]
+    largest_circuits = circuits.largest_sizes(n)
     result = 1
     for circuit in largest_circuits:
         result *= circuit
@@ -111,12 +498,10 @@ if __name__ == "__main__":
     junction_boxes = read_file(Path(sys.argv[1]))
     connection_count = int(sys.argv[2]) if len(sys.argv) == 3 else 10
 
-    connections = calculate_distances(junction_boxes)
-
-    circuits, _ = make_shortest_connections(connections, connection_count)
+    circuits, _ = make_shortest_connections_spatial(junction_boxes, connection_count)
     largest_circuits_sizes = count_circuit_sizes(circuits, 3)
     print(f"Phase 1: {largest_circuits_sizes}")
 
-    _, spanning_tree = find_spanning_tree(junction_boxes, connections)
+    _, spanning_tree = find_spanning_tree_spatial(junction_boxes)
     x = phase2(spanning_tree)
     print(f"Phase 2: {x}")
@@ -1,5 +1,8 @@
 import sys
-from itertools import combinations, pairwise, chain
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, combinations, pairwise, chain
+from operator import add
 from pathlib import Path
 from typing import NamedTuple, Final
 
@@ -51,6 +54,16 @@ class Polygon:
         self.__find_max()
         self.__create_edges()
 
+        # Sorted by their fixed coordinate, so a query can bisect to the span it covers
+        self.__corner_ys_by_x: dict[int, list[int]] = {}
+        for corner in sorted(self.__corners):
+            self.__corner_ys_by_x.setdefault(corner.x, []).append(corner.y)
+        self.__corner_xs: list[int] = sorted(self.__corner_ys_by_x)
+        self.__horizontal_edges_by_y: list[Line] = sorted(self.__horizontal_edges, key=lambda edge: edge.a.y)
+        self.__horizontal_edge_ys: list[int] = [edge.a.y for edge in self.__horizontal_edges_by_y]
+        self.__vertical_edges_by_x: list[Line] = sorted(self.__vertical_edges, key=lambda edge: edge.a.x)
+        self.__vertical_edge_xs: list[int] = [edge.a.x for edge in self.__vertical_edges_by_x]
+
     def __find_max(self) -> None:
         for corner in self.__corners:
             self.__x_max = max(self.__x_max, corner.x)
@@ -77,16 +90,26 @@ class Polygon:
         y_min = min(ys)
         y_max = max(ys)
 
-        for corner in self.__corners:
-            if x_min < corner.x < x_max and y_min < corner.y < y_max:
+        start = bisect_right(self.__corner_xs, x_min)
+        end = bisect_left(self.__corner_xs, x_max)
+        for i in range(start, end):
+            corner_ys = self.__corner_ys_by_x[self.__corner_xs[i]]
+            j = bisect_right(corner_ys, y_min)
+            if j < len(corner_ys) and corner_ys[j] < y_max:
                 return False
 
-        for edge in self.__horizontal_edges:
-            if y_min < edge.a.y < y_max and edge.a.x <= x_min and x_max <= edge.b.x:
+        start = bisect_right(self.__horizontal_edge_ys, y_min)
+        end = bisect_left(self.__horizontal_edge_ys, y_max)
+        for i in range(start, end):
+            edge = self.__horizontal_edges_by_y[i]
+            if edge.a.x <= x_min and x_max <= edge.b.x:
                 return False
 
-        for edge in self.__vertical_edges:
-            if x_min < edge.a.x < x_max and edge.a.y <= y_min and y_max <= edge.b.y:
+        start = bisect_right(self.__vertical_edge_xs, x_min)
+        end = bisect_left(self.__vertical_edge_xs, x_max)
+        for i in range(start, end):
+            edge = self.__vertical_edges_by_x[i]
+            if edge.a.y <= y_min and y_max <= edge.b.y:
                 return False
 
         return True
@@ -113,6 +136,89 @@ class Polygon:
         return "\n".join(result)
 
 
+class CompressedPolygon:
+    # Rasterises the polygon once onto its compressed coordinates: even grid
+    # indices are the corner coordinates, odd indices the gaps between them.
+    # A 2D prefix sum of the outside cells then answers rectangle checks in O(1).
+    def __init__(self, corners: list[Point]) -> None:
+        self.__xs: list[int] = sorted({corner.x for corner in corners})
+        self.__ys: list[int] = sorted({corner.y for corner in corners})
+        self.__x_idx: dict[int, int] = {x: 2 * i for i, x in enumerate(self.__xs)}
+        self.__y_idx: dict[int, int] = {y: 2 * i for i, y in enumerate(self.__ys)}
+        self.__width: int = 2 * len(self.__xs) - 1
+        self.__prefix: list[array[int]] = []
+
+        self.__build_prefix(self.__rasterise(corners))
+
+    def __rasterise(self, corners: list[Point]) -> list[bytearray]:
+        vertical_edges_starting: dict[int, list[int]] = {}
+        vertical_edges_ending: dict[int, list[int]] = {}
+        horizontal_edges: dict[int, list[tuple[int, int]]] = {}
+        for tile1, tile2 in pairwise(chain(corners, [corners[0]])):
+            if tile1.x == tile2.x:
+                y_min, y_max = min(tile1.y, tile2.y), max(tile1.y, tile2.y)
+                vertical_edges_starting.setdefault(y_min, []).append(self.__x_idx[tile1.x])
+                vertical_edges_ending.setdefault(y_max, []).append(self.__x_idx[tile1.x])
+            else:
+                x_min, x_max = min(tile1.x, tile2.x), max(tile1.x, tile2.x)
+                horizontal_edges.setdefault(tile1.y, []).append((self.__x_idx[x_min], self.__x_idx[x_max]))
+
+        empty_row = bytearray(self.__width)
+        rows: list[bytearray] = []
+        active_edges: list[int] = []
+        previous_band = empty_row
+        for k, y in enumerate(self.__ys):
+            for x in vertical_edges_ending.get(y, []):
+                active_edges.remove(x)
+            for x in vertical_edges_starting.get(y, []):
+                insort(active_edges, x)
+
+            # Band between this y and the next one: fill between pairs of crossing edges
+            band = bytearray(self.__width)
+            for left, right in zip(active_edges[0::2], active_edges[1::2]):
+                band[left:right + 1] = b"\x01" * (right - left + 1)
+
+            # The corner row is inside wherever one of its neighbouring bands is
+            row = int.from_bytes(previous_band) | int.from_bytes(band)
+            line = bytearray(row.to_bytes(self.__width))
+            for left, right in horizontal_edges.get(y, []):
+                line[left:right + 1] = b"\x01" * (right - left + 1)
+
+            rows.append(line)
+            if k + 1 < len(self.__ys):
+                rows.append(band)
+            previous_band = band
+
+        return rows
+
+    def __build_prefix(self, rows: list[bytearray]) -> None:
+        # Gaps between neighbouring coordinates contain no tiles, so they never count as outside
+        real_columns = bytearray(self.__width)
+        for i in range(0, self.__width):
+            real_columns[i] = i % 2 == 0 or self.__xs[i // 2 + 1] - self.__xs[i // 2] > 1
+        real_columns_mask = int.from_bytes(real_columns)
+
+        to_outside = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+        previous = array("i", [0]) * (self.__width + 1)
+        self.__prefix = [previous]
+        for i, row in enumerate(rows):
+            if i % 2 == 0 or self.__ys[i // 2 + 1] - self.__ys[i // 2] > 1:
+                outside_mask = int.from_bytes(row.translate(to_outside)) & real_columns_mask
+                outside = accumulate(outside_mask.to_bytes(self.__width), initial=0)
+                previous = array("i", map(add, previous, outside))
+            self.__prefix.append(previous)
+
+    def is_rectangle_inside(self, rectangle: tuple[Point, ...]) -> bool:
+        x1 = min(self.__x_idx[p.x] for p in rectangle)
+        x2 = max(self.__x_idx[p.x] for p in rectangle) + 1
+        y1 = min(self.__y_idx[p.y] for p in rectangle)
+        y2 = max(self.__y_idx[p.y] for p in rectangle) + 1
+
+        prefix = self.__prefix
+        outside = prefix[y2][x2] - prefix[y1][x2] - prefix[y2][x1] + prefix[y1][x1]
+        return outside == 0
+
+
 def read_file(file_name: Path) -> list[Point]:
     result = []
     with open(file_name) as f:
@@ -135,7 +241,7 @@ def get_biggest_rect(red_tiles: list[Point]) -> int:
     return max_size
 
 
-def get_biggest_rect_2(red_tiles: list[Point], polygon: Polygon) -> int | None:
+def get_biggest_rect_2(red_tiles: list[Point], polygon: Polygon | CompressedPolygon) -> int | None:
     candidates = []
     for tile1, tile2 in combinations(red_tiles, 2):
         a = abs(tile1.x - tile2.x) + 1
@@ -153,6 +259,49 @@ def get_biggest_rect_2(red_tiles: list[Point], polygon: Polygon) -> int | None:
     return None
 
 
+def find_biggest_rect_pruned(
+    red_tiles: list[Point], polygon: Polygon | CompressedPolygon
+) -> tuple[int | None, int]:
+    # Visits anchors by the biggest area the bounding box would still allow and
+    # stops once no anchor can beat the best valid rectangle. An anchor is only
+    # paired with the tiles that were not anchors yet, so every pair is sized once
+    # and only one anchor's candidates are held at a time. Returns the size and
+    # the validated candidates.
+    x_min = min(tile.x for tile in red_tiles)
+    x_max = max(tile.x for tile in red_tiles)
+    y_min = min(tile.y for tile in red_tiles)
+    y_max = max(tile.y for tile in red_tiles)
+
+    anchors = []
+    for tile in red_tiles:
+        a = max(tile.x - x_min, x_max - tile.x) + 1
+        b = max(tile.y - y_min, y_max - tile.y) + 1
+        anchors.append((a * b, tile))
+    anchors.sort(reverse=True)
+
+    best_size = None
+    examined = 0
+    for i, (upper_bound, tile1) in enumerate(anchors):
+        if best_size is not None and upper_bound <= best_size:
+            break
+
+        candidates = []
+        for _, tile2 in anchors[i + 1:]:
+            size = (abs(tile1.x - tile2.x) + 1) * (abs(tile1.y - tile2.y) + 1)
+            if best_size is None or size > best_size:
+                candidates.append((size, tile2))
+        candidates.sort(reverse=True)
+
+        for size, tile2 in candidates:
+            examined += 1
+            rect = (Point(tile1.x, tile1.y), Point(tile1.x, tile2.y), Point(tile2.x, tile2.y), Point(tile2.x, tile1.y))
+            if polygon.is_rectangle_inside(rect):
+                best_size = size
+                break
+
+    return best_size, examined
+
+
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print("Please provide the input file!", file=sys.stderr)
@@ -163,6 +312,6 @@ if __name__ == "__main__":
     result = get_biggest_rect(red_tiles)
     print(f"Phase 1: {result}")
 
-    polygon = Polygon(red_tiles)
-    result = get_biggest_rect_2(red_tiles, polygon)
+    polygon = CompressedPolygon(red_tiles)
+    result, _ = find_biggest_rect_pruned(red_tiles, polygon)
     print(f"Phase 2: {result}")
@@ -1,10 +1,11 @@
 import sys
 from collections import deque
+from collections.abc import Callable
 from multiprocessing import Pool
 from pathlib import Path
 from typing import NamedTuple
 
-from utils.simplex import Simplex
+from utils.simplex import NodeSelection, Simplex
 
 
 IndicatorLigths = tuple[bool, ...]
@@ -87,7 +88,92 @@ def find_initialization_procedure(machine: Machine) -> int:
     return -1
 
 
-def find_joltage_configuration(machine: Machine) -> int:
+def lights_to_mask(lights: IndicatorLigths) -> int:
+    return sum(1 << i for i, light in enumerate(lights) if light)
+
+
+def button_to_mask(button: Button) -> int:
+    mask = 0
+    for wire in button:
+        mask ^= 1 << wire
+    return mask
+
+
+def find_initialization_procedure_bitmask(machine: Machine) -> int:
+    target_lights = lights_to_mask(machine.lights)
+    buttons = [button_to_mask(button) for button in machine.buttons]
+
+    if target_lights == 0:
+        return 0
+
+    queue = deque([(0, 0)])
+    seen = {0}
+    while len(queue) > 0:
+        lights, button_presses = queue.popleft()
+
+        for button in buttons:
+            new_lights = lights ^ button
+
+            if new_lights == target_lights:
+                return button_presses + 1
+
+            if new_lights in seen:
+                continue
+            seen.add(new_lights)
+
+            queue.append((new_lights, button_presses + 1))
+
+    return -1
+
+
+def find_initialization_procedure_gf2(machine: Machine) -> int:
+    # Pressing a button twice cancels out, so the presses are a solution of
+    # buttons * x = lights over GF(2). Gaussian elimination leaves only the free
+    # variables to enumerate for the solution with the fewest presses.
+    button_count = len(machine.buttons)
+    buttons = [button_to_mask(button) for button in machine.buttons]
+
+    # One row per light: bit j is set if button j toggles it, the rhs is the target state
+    rows = []
+    for i, light in enumerate(machine.lights):
+        coefficients = sum(1 << j for j, button in enumerate(buttons) if button >> i & 1)
+        rows.append((coefficients, int(light)))
+
+    pivots: list[tuple[int, int, int]] = []  # column, coefficients, rhs
+    for column in range(0, button_count):
+        pivot_idx = next((i for i, (c, _) in enumerate(rows) if c >> column & 1), None)
+        if pivot_idx is None:
+            continue
+
+        pivot_coefficients, pivot_rhs = rows.pop(pivot_idx)
+        rows = [(c ^ pivot_coefficients, r ^ pivot_rhs) if c >> column & 1 else (c, r) for c, r in rows]
+        pivots = [
+            (p, c ^ pivot_coefficients, r ^ pivot_rhs) if c >> column & 1 else (p, c, r) for p, c, r in pivots
+        ]
+        pivots.append((column, pivot_coefficients, pivot_rhs))
+
+    if any(r for c, r in rows):
+        return -1  # inconsistent, the lights cannot be reached
+
+    pivot_columns = {p for p, _, _ in pivots}
+    free_columns = [j for j in range(0, button_count) if j not in pivot_columns]
+
+    min_presses = button_count + 1
+    for assignment in range(0, 1 << len(free_columns)):
+        free_mask = 0
+        for k, column in enumerate(free_columns):
+            if assignment >> k & 1:
+                free_mask |= 1 << column
+
+        presses = free_mask.bit_count()
+        for column, coefficients, rhs in pivots:
+            presses += rhs ^ ((coefficients & free_mask).bit_count() & 1)
+        min_presses = min(min_presses, presses)
+
+    return min_presses
+
+
+def find_joltage_configuration(machine: Machine, processes: int | None = 1) -> int:
     button_count = len(machine.buttons)
 
     simplex = Simplex(tuple([-1] * button_count))
@@ -96,7 +182,7 @@ def find_joltage_configuration(machine: Machine) -> int:
         lhs = [int(i in b) for b in machine.buttons]
         simplex.addEqConsraint(lhs, requirement)
 
-    solve_result = simplex.solve_integer()
+    solve_result = simplex.solve_integer(node_selection=NodeSelection.BEST_BOUND, processes=processes)
     if solve_result is None:
         print(f"Unable to find joltage configuration for {machine}")
         return 0
@@ -107,12 +193,19 @@ def find_joltage_configuration(machine: Machine) -> int:
     return -1 * int(optimal_value)
 
 
-def run_initialization_procedures(machines: list[Machine]) -> int:
+def run_initialization_procedures(
+    machines: list[Machine], solver: Callable[[Machine], int] = find_initialization_procedure_gf2
+) -> int:
     with Pool() as thread_pool:
-        return sum(thread_pool.imap(find_initialization_procedure, machines))
+        return sum(thread_pool.imap(solver, machines))
+
 
+def run_joltage_configuration(machines: list[Machine], parallel_tree: bool = False) -> int:
+    # Either one machine per process, or one machine after the other with its
+    # search tree spread over all processes, for batches with a single hard machine.
+    if parallel_tree:
+        return sum(find_joltage_configuration(machine, processes=None) for machine in machines)
 
-def run_joltage_configuration(machines: list[Machine]) -> int:
     with Pool() as thread_pool:
         return sum(thread_pool.imap(find_joltage_configuration, machines))
 
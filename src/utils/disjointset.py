@@ -1,47 +1,176 @@
+import heapq
+from array import array
+from collections.abc import Iterable
 from typing import Generic, TypeVar
 
 T = TypeVar("T")
 
 
-class DisjointSet(Generic[T]):
-    def __init__(self) -> None:
-        self._parents: dict[T, T] = {}
-        self._sizes: dict[T, int] = {}
+class IntDisjointSet:
+    # In rollback mode find() does not compress paths and every union is logged,
+    # so all unions since a checkpoint can be undone. Elements added after a
+    # checkpoint stay in the set as singletons.
+    def __init__(self, n: int = 0, rollback: bool = False) -> None:
+        self._parents: array[int] = array("i", range(0, n))
+        self._sizes: array[int] = array("i", [1]) * n
+        self._roots: set[int] = set(range(0, n))
+        self._rollback: bool = rollback
+        self._log: list[tuple[int, int]] = []
+        self._checkpoints: list[int] = []
 
-    def union(self, a: T, b: T) -> tuple[T, int]:
+    def add(self) -> int:
+        idx = len(self._parents)
+        self._parents.append(idx)
+        self._sizes.append(1)
+        self._roots.add(idx)
+        return idx
+
+    def union(self, a: int, b: int) -> tuple[int, int]:
         a = self.find(a)
         b = self.find(b)
 
-        if a == b:
-            return a, self._sizes[a]
+        if a != b:
+            a = self.__link(a, b)
+        return a, self._sizes[a]
+
+    def union_many(self, pairs: Iterable[tuple[int, int]]) -> int:
+        # find() is inlined, only the unions that merge two sets pay a method call
+        parents = self._parents
+        compress = not self._rollback
+        link = self.__link
+
+        merged = 0
+        for a, b in pairs:
+            while parents[a] != a:
+                if compress:
+                    parents[a] = parents[parents[a]]
+                a = parents[a]
+            while parents[b] != b:
+                if compress:
+                    parents[b] = parents[parents[b]]
+                b = parents[b]
 
+            if a != b:
+                link(a, b)
+                merged += 1
+
+        return merged
+
+    def __link(self, a: int, b: int) -> int:
+        # Hangs the smaller of the roots a and b below the bigger one and returns it
         if self._sizes[a] < self._sizes[b]:
-            self._parents[a] = b
-            self._sizes[b] += self._sizes[a]
-            return b, self._sizes[b]
-        else:
-            self._parents[b] = a
-            self._sizes[a] += self._sizes[b]
-            return a, self._sizes[a]
+            a, b = b, a
 
-    def find(self, a: T) -> T:
-        if a not in self._parents:
-            self._parents[a] = a
-            self._sizes[a] = 1
-            return a
+        self._parents[b] = a
+        self._sizes[a] += self._sizes[b]
+        self._roots.discard(b)
+        if self._rollback:
+            self._log.append((a, b))
+        return a
 
-        parent = self._parents[a]
-        if parent == a:
+    def checkpoint(self) -> int:
+        if not self._rollback:
+            raise ValueError("checkpoints need a disjoint set in rollback mode")
+        self._checkpoints.append(len(self._log))
+        return len(self._checkpoints)
+
+    def rollback(self) -> None:
+        if not self._checkpoints:
+            raise ValueError("no checkpoint to roll back to")
+
+        target = self._checkpoints.pop()
+        while len(self._log) > target:
+            a, b = self._log.pop()
+            self._parents[b] = b
+            self._sizes[a] -= self._sizes[b]
+            self._roots.add(b)
+
+    def find(self, a: int) -> int:
+        parents = self._parents
+        if self._rollback:
+            while parents[a] != a:
+                a = parents[a]
             return a
 
-        self._parents[a] = self.find(parent)
-        return self._parents[a]
+        while parents[a] != a:
+            # Path halving: point every other node on the way to its grandparent
+            parents[a] = parents[parents[a]]
+            a = parents[a]
+        return a
+
+    def size(self, a: int) -> int:
+        return self._sizes[self.find(a)]
+
+    @property
+    def component_count(self) -> int:
+        return len(self._roots)
+
+    def roots(self) -> set[int]:
+        return set(self._roots)
+
+    def values(self) -> set[tuple[int, int]]:
+        return {(root, self._sizes[root]) for root in self._roots}
+
+    def largest_sizes(self, k: int) -> list[int]:
+        return heapq.nlargest(k, (self._sizes[root] for root in self._roots))
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+
+class DisjointSet(Generic[T]):
+    def __init__(self, rollback: bool = False) -> None:
+        self._indices: dict[T, int] = {}
+        self._elements: list[T] = []
+        self._set = IntDisjointSet(rollback=rollback)
+
+    def __index(self, a: T) -> int:
+        idx = self._indices.get(a)
+        if idx is None:
+            idx = self._set.add()
+            self._indices[a] = idx
+            self._elements.append(a)
+        return idx
+
+    def union(self, a: T, b: T) -> tuple[T, int]:
+        root, size = self._set.union(self.__index(a), self.__index(b))
+        return self._elements[root], size
+
+    def union_many(self, pairs: Iterable[tuple[T, T]]) -> int:
+        # Known elements are looked up directly, only new ones go through __index()
+        indices = self._indices
+        index = self.__index
+
+        def index_pairs() -> Iterable[tuple[int, int]]:
+            for a, b in pairs:
+                idx_a = indices.get(a)
+                if idx_a is None:
+                    idx_a = index(a)
+                idx_b = indices.get(b)
+                if idx_b is None:
+                    idx_b = index(b)
+                yield idx_a, idx_b
+
+        return self._set.union_many(index_pairs())
+
+    def checkpoint(self) -> int:
+        return self._set.checkpoint()
+
+    def rollback(self) -> None:
+        self._set.rollback()
+
+    def find(self, a: T) -> T:
+        return self._elements[self._set.find(self.__index(a))]
+
+    @property
+    def component_count(self) -> int:
+        return self._set.component_count
 
     def values(self) -> set[tuple[T, int]]:
-        result = set()
-        for elem in self._parents:
-            result.add((elem, self._sizes[elem]))
-        return result
+        return {(self._elements[root], size) for root, size in self._set.values()}
+
+    def largest_sizes(self, k: int) -> list[int]:
+        return self._set.largest_sizes(k)
 
     def __contains__(self, item: T) -> bool:
-        return item in self._parents
+        return item in self._indices
@@ -0,0 +1,70 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+
+
+# Set of integers stored as sorted, disjoint and inclusive [start, end] intervals.
+class IntervalSet:
+    def __init__(self, intervals: list[tuple[int, int]] | None = None) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._total: int = 0
+
+        for start, end in intervals or []:
+            self.add(start, end)
+
+    def add(self, start: int, end: int) -> None:
+        if start > end:
+            return
+
+        # Every stored interval overlapping or touching [start, end] is merged into it.
+        i = bisect_left(self._ends, start - 1)
+        j = bisect_right(self._starts, end + 1)
+
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+            self._total -= self.__count(i, j)
+
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+        self._total += end - start + 1
+
+    def remove(self, start: int, end: int) -> None:
+        if start > end:
+            return
+
+        i = bisect_left(self._ends, start)
+        j = bisect_right(self._starts, end)
+        if i >= j:
+            return
+
+        remaining_starts = []
+        remaining_ends = []
+        if self._starts[i] < start:
+            remaining_starts.append(self._starts[i])
+            remaining_ends.append(start - 1)
+        if self._ends[j - 1] > end:
+            remaining_starts.append(end + 1)
+            remaining_ends.append(self._ends[j - 1])
+
+        self._total -= self.__count(i, j)
+        self._starts[i:j] = remaining_starts
+        self._ends[i:j] = remaining_ends
+        self._total += sum(b - a + 1 for a, b in zip(remaining_starts, remaining_ends))
+
+    def __count(self, i: int, j: int) -> int:
+        return sum(self._ends[i:j]) - sum(self._starts[i:j]) + (j - i)
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def __contains__(self, value: int) -> bool:
+        idx = bisect_right(self._starts, value) - 1
+        return idx >= 0 and value <= self._ends[idx]
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        return len(self._starts)
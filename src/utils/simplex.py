@@ -1,10 +1,18 @@
+import heapq
+import os
+from copy import copy
 from dataclasses import dataclass
 from enum import Enum
 from fractions import Fraction
 from math import floor, ceil
+from multiprocessing import Pool, Value
+from time import perf_counter
 from typing import NamedTuple, Iterable
 
-BigM = 2**64
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
 
 
 class SimplexConstraintType(Enum):
@@ -19,6 +27,175 @@ class SimplexConstraint(NamedTuple):
     rhs: int
 
 
+class SimplexBackend(Enum):
+    FRACTION = 1
+    NUMPY = 2
+    REVISED = 3
+
+
+class NodeSelection(Enum):
+    DEPTH_FIRST = 1
+    BEST_BOUND = 2
+    HYBRID = 3  # Depth first until the first integer solution, best bound afterwards
+
+
+class SimplexStandardForm(NamedTuple):
+    # max profit * x subject to lhs * x = rhs, x >= 0 with one slack or surplus
+    # column per inequality and one artificial column per row that needs one.
+    lhs: list[list[int]]
+    rhs: list[int]
+    profit: list[int]
+    var_count: int
+    artificials: list[int]
+    initial_basis: list[int]
+
+    @classmethod
+    def build(cls, profit: tuple[int, ...], constraints: Iterable[SimplexConstraint]) -> "SimplexStandardForm":
+        rows: list[tuple[list[int], int, SimplexConstraintType]] = []
+        for constraint in constraints:
+            lhs = list(constraint.lhs)
+            rhs = constraint.rhs
+            type_ = constraint.type_
+            if rhs < 0:
+                lhs = [-x for x in lhs]
+                rhs = -rhs
+                if type_ == SimplexConstraintType.LEQ:
+                    type_ = SimplexConstraintType.GEQ
+                elif type_ == SimplexConstraintType.GEQ:
+                    type_ = SimplexConstraintType.LEQ
+            rows.append((lhs, rhs, type_))
+
+        var_count = len(profit)
+        extra_columns = sum(2 if type_ == SimplexConstraintType.GEQ else 1 for _, _, type_ in rows)
+        column_count = var_count + extra_columns
+
+        standard_lhs = []
+        standard_rhs = []
+        artificials = []
+        initial_basis = []
+        column = var_count
+        for lhs, rhs, type_ in rows:
+            row = lhs + [0] * extra_columns
+            match type_:
+                case SimplexConstraintType.LEQ:
+                    row[column] = 1
+                    initial_basis.append(column)
+                    column += 1
+                case SimplexConstraintType.EQ:
+                    row[column] = 1
+                    artificials.append(column)
+                    initial_basis.append(column)
+                    column += 1
+                case SimplexConstraintType.GEQ:
+                    row[column] = -1
+                    row[column + 1] = 1
+                    artificials.append(column + 1)
+                    initial_basis.append(column + 1)
+                    column += 2
+            standard_lhs.append(row)
+            standard_rhs.append(rhs)
+
+        standard_profit = list(profit) + [0] * (column_count - var_count)
+        return cls(standard_lhs, standard_rhs, standard_profit, var_count, artificials, initial_basis)
+
+    def __eliminate_basis(self, basis: list[int]) -> tuple[int, list[list[int]]] | None:
+        # Fraction-free Gauss-Jordan elimination (Bareiss) of [B | rhs | I].
+        # Afterwards every row reads det * [I | B^-1 rhs | B^-1] in exact integers.
+        row_count = len(self.rhs)
+        matrix = [
+            [self.lhs[i][j] for j in basis] + [self.rhs[i]] + [int(i == k) for k in range(0, row_count)]
+            for i in range(0, row_count)
+        ]
+
+        previous_pivot = 1
+        for column in range(0, row_count):
+            pivot = next((i for i in range(column, row_count) if matrix[i][column] != 0), None)
+            if pivot is None:
+                return None  # singular basis
+            matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+
+            pivot_row = matrix[column]
+            pivot_value = pivot_row[column]
+            for i in range(0, row_count):
+                if i == column:
+                    continue
+                row = matrix[i]
+                factor = row[column]
+                matrix[i] = [(pivot_value * x - factor * y) // previous_pivot for x, y in zip(row, pivot_row)]
+            previous_pivot = pivot_value
+
+        # Earlier rows were scaled by later pivots as well, so all diagonals equal the determinant
+        return previous_pivot, matrix
+
+    def evaluate_basis(
+        self, basis: list[int], costs: list[int], allowed: set[int]
+    ) -> tuple[Fraction, list[Fraction]] | None:
+        # Returns the objective value and the basic values if the basis is primal
+        # feasible and no allowed column has a positive reduced cost.
+        row_count = len(self.rhs)
+        if len(basis) != row_count:
+            return None
+        if row_count == 0:
+            return (Fraction(0), []) if all(costs[j] <= 0 for j in allowed) else None
+
+        eliminated = self.__eliminate_basis(basis)
+        if eliminated is None:
+            return None
+        determinant, matrix = eliminated
+        sign = 1 if determinant > 0 else -1
+
+        if any(sign * matrix[i][row_count] < 0 for i in range(0, row_count)):
+            return None
+
+        # determinant * duals, with duals = costs_B * B^-1
+        scaled_duals = [0] * row_count
+        for i, column in enumerate(basis):
+            if costs[column] != 0:
+                for k in range(0, row_count):
+                    scaled_duals[k] += costs[column] * matrix[i][row_count + 1 + k]
+
+        basis_set = set(basis)
+        for column in allowed:
+            if column in basis_set:
+                continue
+            scaled_reduced_cost = determinant * costs[column] - sum(
+                scaled_duals[k] * self.lhs[k][column] for k in range(0, row_count) if self.lhs[k][column] != 0
+            )
+            if sign * scaled_reduced_cost > 0:
+                return None
+
+        basic_values = [Fraction(matrix[i][row_count], determinant) for i in range(0, row_count)]
+        objective = sum((costs[column] * value for column, value in zip(basis, basic_values)), Fraction(0))
+        return objective, basic_values
+
+    def verify_basis(self, basis: list[int]) -> tuple[Fraction, tuple[Fraction, ...]] | None:
+        # Confirms in exact arithmetic that a basis is feasible and optimal and
+        # returns its solution. Artificial columns may only stay basic at zero.
+        artificials = set(self.artificials)
+        allowed = {j for j in range(0, len(self.profit)) if j not in artificials}
+        evaluated = self.evaluate_basis(basis, self.profit, allowed)
+        if evaluated is None:
+            return None
+        optimal_value, basic_values = evaluated
+
+        variables = [Fraction(0)] * self.var_count
+        for column, value in zip(basis, basic_values):
+            if column in artificials and value != 0:
+                return None
+            if column < self.var_count:
+                variables[column] = value
+        return optimal_value, tuple(variables)
+
+    def verify_infeasible(self, basis: list[int]) -> bool:
+        # A basis that is optimal for the phase I objective with artificial
+        # variables still above zero proves that there is no feasible solution.
+        costs = [0] * len(self.profit)
+        for column in self.artificials:
+            costs[column] = -1
+        evaluated = self.evaluate_basis(basis, costs, set(range(0, len(self.profit))))
+        return evaluated is not None and evaluated[0] < 0
+
+
 @dataclass
 class SimplexTableauRow:
     lhs: list[Fraction]
@@ -51,25 +228,51 @@ class SimplexTableauRow:
 
 
 class SimplexTableau:
+    # Two-phase tableau: while artificial columns exist the objective row holds
+    # the phase I costs (-1 per artificial), drop_artificials() switches to the
+    # real profit once they are driven to zero.
     def __init__(self, profit: tuple[int, ...], constraints: Iterable[SimplexConstraint]) -> None:
         self.__profit: list[Fraction] = [Fraction(x) for x in profit]
         self.__var_count = len(profit)
         self.__constraints: list[SimplexTableauRow] = []
         self.__basic_variables: list[int] = []
         self.__column_count: int = len(profit)
+        self.__artificials: list[int] = []
 
         self.__build_rows(constraints)
 
+        # The objective row is kept up to date by pivot(): lhs holds costs - zj, rhs holds -zj.rhs
+        if self.__artificials:
+            self.__costs: list[Fraction] = [Fraction(0)] * self.__column_count
+            for column in self.__artificials:
+                self.__costs[column] = Fraction(-1)
+        else:
+            self.__costs = self.__profit
+        self.__objective: SimplexTableauRow = self.__compute_objective()
+
     def __build_rows(self, constraints: Iterable[SimplexConstraint]) -> None:
         self.__constraints = []
         for constraint in constraints:
-            match constraint.type_:
+            lhs, rhs, type_ = constraint.lhs, constraint.rhs, constraint.type_
+            if rhs < 0:
+                # Phase I starts from the slack and artificial basis, which needs rhs >= 0
+                lhs, rhs = tuple(-x for x in lhs), -rhs
+                if type_ == SimplexConstraintType.LEQ:
+                    type_ = SimplexConstraintType.GEQ
+                elif type_ == SimplexConstraintType.GEQ:
+                    type_ = SimplexConstraintType.LEQ
+
+            match type_:
                 case SimplexConstraintType.LEQ:
-                    self.__addLEqConsraint(constraint.lhs, constraint.rhs)
+                    self.__addLEqConsraint(lhs, rhs)
                 case SimplexConstraintType.EQ:
-                    self.__addEqConsraint(constraint.lhs, constraint.rhs)
+                    self.__addEqConsraint(lhs, rhs)
                 case SimplexConstraintType.GEQ:
-                    self.__addGEqConsraint(constraint.lhs, constraint.rhs)
+                    self.__addGEqConsraint(lhs, rhs)
+
+        # Earlier rows only get the slack and artificial columns of later rows at the end
+        for row in self.__constraints:
+            row.pad_lhs(self.__column_count)
 
     def __addLEqConsraint(self, lhs: tuple[int, ...], rhs: int) -> None:
         assert len(lhs) == self.__var_count
@@ -83,8 +286,6 @@ class SimplexTableau:
         self.__profit.append(Fraction(0))
         self.__basic_variables.append(self.__column_count - 1)
 
-        for row in self.__constraints:
-            row.pad_lhs(self.__column_count)
         self.__constraints.append(new_row)
 
     def __addEqConsraint(self, lhs: tuple[int, ...], rhs: int) -> None:
@@ -97,11 +298,10 @@ class SimplexTableau:
 
         self.__column_count += 1
 
-        self.__profit.append(Fraction(-BigM))
+        self.__profit.append(Fraction(0))
+        self.__artificials.append(self.__column_count - 1)
         self.__basic_variables.append(self.__column_count - 1)
 
-        for row in self.__constraints:
-            row.pad_lhs(self.__column_count)
         self.__constraints.append(new_row)
 
     def __addGEqConsraint(self, lhs: tuple[int, ...], rhs: int) -> None:
@@ -116,11 +316,10 @@ class SimplexTableau:
         self.__column_count += 2
 
         self.__profit.append(Fraction(0))
-        self.__profit.append(Fraction(-BigM))
+        self.__profit.append(Fraction(0))
+        self.__artificials.append(self.__column_count - 1)
         self.__basic_variables.append(self.__column_count - 1)
 
-        for row in self.__constraints:
-            row.pad_lhs(self.__column_count)
         self.__constraints.append(new_row)
 
     @property
@@ -128,26 +327,96 @@ class SimplexTableau:
         return self.__constraints
 
     @property
-    def zj(self) -> SimplexTableauRow:
+    def artificial_count(self) -> int:
+        return len(self.__artificials)
+
+    def __compute_objective(self) -> SimplexTableauRow:
+        zj = self.recompute_zj()
+        return SimplexTableauRow(lhs=[x - y for x, y in zip(self.__costs, zj.lhs)], rhs=-zj.rhs)
+
+    def recompute_zj(self) -> SimplexTableauRow:
         lhs: list[Fraction] = []
         for column_idx in range(0, self.__column_count):
             z = Fraction()
             for row_idx in range(0, len(self.__constraints)):
                 idx = self.__basic_variables[row_idx]
-                value = self.__constraints[row_idx].lhs[column_idx] * self.__profit[idx]
+                value = self.__constraints[row_idx].lhs[column_idx] * self.__costs[idx]
                 z += value
             lhs.append(z)
 
         rhs = Fraction()
         for row_idx in range(0, len(self.__constraints)):
             idx = self.__basic_variables[row_idx]
-            value = self.__constraints[row_idx].rhs * self.__profit[idx]
+            value = self.__constraints[row_idx].rhs * self.__costs[idx]
             rhs += value
         return SimplexTableauRow(lhs, rhs)
 
+    @property
+    def zj(self) -> SimplexTableauRow:
+        return SimplexTableauRow([x - y for x, y in zip(self.__costs, self.__objective.lhs)], -self.__objective.rhs)
+
     @property
     def net_evaluation(self) -> list[Fraction]:
-        return [x - y for x, y in zip(self.__profit, self.zj.lhs)]
+        return self.__objective.lhs
+
+    def pivot(self, pivot_row_idx: int, pivot_column_idx: int) -> None:
+        self.set_basic_variable(pivot_row_idx, pivot_column_idx)
+
+        # Pivot the Row
+        pivot_row = self.__constraints[pivot_row_idx]
+        pivot_row /= pivot_row.lhs[pivot_column_idx]
+
+        # Pivot the Column, including the objective row
+        for row_idx, row in enumerate(self.__constraints):
+            if row_idx == pivot_row_idx:
+                continue
+            factor = row.lhs[pivot_column_idx]
+            if factor != 0:
+                row -= factor * pivot_row
+
+        factor = self.__objective.lhs[pivot_column_idx]
+        if factor != 0:
+            self.__objective -= factor * pivot_row
+
+    def drop_artificials(self) -> bool:
+        # Ends phase I. Returns False if the artificials could not be driven to
+        # zero, i.e. there is no feasible solution.
+        if self.__objective.rhs != 0:
+            return False
+
+        artificials = set(self.__artificials)
+        redundant_rows: set[int] = set()
+        for row_idx, basic_var in enumerate(self.__basic_variables):
+            if basic_var not in artificials:
+                continue
+            # Basic at zero: swap it for any real column, or drop the row if there is none
+            row = self.__constraints[row_idx]
+            column = next((i for i, x in enumerate(row.lhs) if x != 0 and i not in artificials), None)
+            if column is None:
+                redundant_rows.add(row_idx)
+            else:
+                self.pivot(row_idx, column)
+
+        kept_columns = [i for i in range(0, self.__column_count) if i not in artificials]
+        new_index = {column: i for i, column in enumerate(kept_columns)}
+        self.__constraints = [
+            SimplexTableauRow([row.lhs[i] for i in kept_columns], row.rhs)
+            for row_idx, row in enumerate(self.__constraints)
+            if row_idx not in redundant_rows
+        ]
+        self.__basic_variables = [
+            new_index[basic_var]
+            for row_idx, basic_var in enumerate(self.__basic_variables)
+            if row_idx not in redundant_rows
+        ]
+        self.__profit = [self.__profit[i] for i in kept_columns]
+        self.__column_count = len(kept_columns)
+        self.__artificials = []
+
+        # Phase II
+        self.__costs = self.__profit
+        self.__objective = self.__compute_objective()
+        return True
 
     def set_basic_variable(self, row: int, idx: int) -> None:
         self.__basic_variables[row] = idx
@@ -157,23 +426,815 @@ class SimplexTableau:
         for i, basic_var in enumerate(self.__basic_variables):
             if basic_var < self.__var_count:
                 variables[basic_var] = self.__constraints[i].rhs
-        return self.zj.rhs, tuple(variables)
+        return -self.__objective.rhs, tuple(variables)
 
     def __str__(self) -> str:
         result = ""
-        result += f"    {' '.join(map(str, self.__profit))}\n"
+        result += f"    {' '.join(map(str, self.__costs))}\n"
         for i, row in enumerate(self.__constraints):
             result += f"{self.__basic_variables[i]} | {' '.join(map(str, row.lhs))} | {str(row.rhs)}\n"
-        result += f"    {' '.join(map(str, self.zj.lhs))} | {str(self.zj.rhs)}\n"
+        zj = self.zj
+        result += f"    {' '.join(map(str, zj.lhs))} | {str(zj.rhs)}\n"
         result += f"    {' '.join(map(str, self.net_evaluation))}\n"
         return result
 
 
+class NumpySimplexTableau:
+    # Dense float64 tableau solved with the two-phase method. The result is only
+    # a candidate basis, it has to be confirmed with SimplexStandardForm.verify_basis.
+    def __init__(self, standard_form: SimplexStandardForm, tolerance: float = 1e-9) -> None:
+        if np is None:
+            raise ImportError("NumpySimplexTableau requires numpy")
+
+        row_count = len(standard_form.rhs)
+        column_count = len(standard_form.profit)
+
+        self.__tolerance: float = tolerance
+        self.__table = np.zeros((row_count + 1, column_count + 1), dtype=np.float64)
+        if row_count > 0:
+            self.__table[:row_count, :column_count] = np.array(standard_form.lhs, dtype=np.float64)
+            self.__table[:row_count, column_count] = np.array(standard_form.rhs, dtype=np.float64)
+        self.__basis: list[int] = list(standard_form.initial_basis)
+        self.__profit = np.array(standard_form.profit, dtype=np.float64)
+        self.__allowed = np.ones(column_count, dtype=bool)
+        self.__allowed[standard_form.artificials] = False
+        self.__artificials: list[int] = standard_form.artificials
+        self.__max_iterations: int = 50 * (row_count + column_count + 1)
+        self.__infeasible: bool = False
+
+    @property
+    def basis(self) -> list[int]:
+        return self.__basis
+
+    @property
+    def infeasible(self) -> bool:
+        return self.__infeasible
+
+    def __set_objective(self, costs) -> None:
+        row_count = len(self.__basis)
+        basic_costs = costs[self.__basis]
+        self.__table[-1, :-1] = costs - basic_costs @ self.__table[:row_count, :-1]
+        self.__table[-1, -1] = -(basic_costs @ self.__table[:row_count, -1])
+
+    def __pivot(self, pivot_row: int, pivot_column: int) -> None:
+        table = self.__table
+        table[pivot_row] /= table[pivot_row, pivot_column]
+        factors = table[:, pivot_column].copy()
+        factors[pivot_row] = 0
+        table -= np.outer(factors, table[pivot_row])
+        self.__basis[pivot_row] = pivot_column
+
+    def __optimize(self, allowed) -> bool:
+        table = self.__table
+        row_count = len(self.__basis)
+        for _ in range(0, self.__max_iterations):
+            reduced_costs = np.where(allowed, table[-1, :-1], -np.inf)
+            pivot_column = int(np.argmax(reduced_costs))
+            if reduced_costs[pivot_column] <= self.__tolerance:
+                return True
+
+            column = table[:row_count, pivot_column]
+            candidates = column > self.__tolerance
+            if not candidates.any():
+                return False  # Unbound
+
+            # Round-off can leave a degenerate rhs slightly below zero, treat it as zero
+            rhs = np.maximum(table[:row_count, -1], 0)
+            ratios = np.full(row_count, np.inf)
+            ratios[candidates] = rhs[candidates] / column[candidates]
+            self.__pivot(int(np.argmin(ratios)), pivot_column)
+
+        return False
+
+    def solve(self) -> bool:
+        row_count = len(self.__basis)
+
+        if self.__artificials:
+            # Phase I: drive the artificial variables to zero
+            costs = np.zeros(len(self.__profit))
+            costs[self.__artificials] = -1
+            self.__set_objective(costs)
+            if not self.__optimize(np.ones(len(self.__profit), dtype=bool)):
+                return False
+            # The corner holds minus the objective, here the sum of the artificial variables
+            if self.__table[-1, -1] > self.__tolerance * max(1.0, float(np.abs(self.__table[:row_count, -1]).max())):
+                self.__infeasible = True
+                return False
+
+            artificials = set(self.__artificials)
+            for row_idx in range(0, row_count):
+                if self.__basis[row_idx] not in artificials:
+                    continue
+                candidates = np.flatnonzero(self.__allowed & (np.abs(self.__table[row_idx, :-1]) > self.__tolerance))
+                if len(candidates) > 0:
+                    self.__pivot(row_idx, int(candidates[0]))
+
+        # Phase II: optimize the real profit without the artificial columns
+        self.__set_objective(self.__profit)
+        return self.__optimize(self.__allowed)
+
+
+class SparseStandardForm(NamedTuple):
+    # Same standard form as SimplexStandardForm, but the matrix is stored as
+    # sparse columns of (row, value) so that building it costs O(nonzeros).
+    columns: list[list[tuple[int, int]]]
+    rhs: list[int]
+    profit: list[int]
+    var_count: int
+    artificials: list[int]
+    initial_basis: list[int]
+
+    @classmethod
+    def build(cls, profit: tuple[int, ...], constraints: Iterable[SimplexConstraint]) -> "SparseStandardForm":
+        var_count = len(profit)
+        columns: list[list[tuple[int, int]]] = [[] for _ in range(0, var_count)]
+        rhs: list[int] = []
+        artificials: list[int] = []
+        initial_basis: list[int] = []
+
+        for row, constraint in enumerate(constraints):
+            sign = -1 if constraint.rhs < 0 else 1
+            type_ = constraint.type_
+            if sign < 0 and type_ != SimplexConstraintType.EQ:
+                type_ = SimplexConstraintType.GEQ if type_ == SimplexConstraintType.LEQ else SimplexConstraintType.LEQ
+
+            for j, value in enumerate(constraint.lhs):
+                if value != 0:
+                    columns[j].append((row, sign * value))
+            rhs.append(sign * constraint.rhs)
+
+            if type_ == SimplexConstraintType.GEQ:
+                columns.append([(row, -1)])
+            if type_ != SimplexConstraintType.LEQ:
+                artificials.append(len(columns))
+            initial_basis.append(len(columns))
+            columns.append([(row, 1)])
+
+        standard_profit = list(profit) + [0] * (len(columns) - var_count)
+        return cls(columns, rhs, standard_profit, var_count, artificials, initial_basis)
+
+
+class RevisedSimplex:
+    # Revised simplex in exact arithmetic on a SparseStandardForm. The basis
+    # inverse is kept in product form, B^-1 = E_k ... E_1, where every eta
+    # matrix E is the identity apart from one column. Each eta is stored as
+    # (row, 1 / pivot, [(i, -d_i / pivot), ...]) for the nonzeros of that column.
+    def __init__(self, standard_form: SparseStandardForm, refactor_interval: int = 64) -> None:
+        self.__form: SparseStandardForm = standard_form
+        self.__basis: list[int] = list(standard_form.initial_basis)
+        self.__values: list[Fraction] = [Fraction(x) for x in standard_form.rhs]
+        self.__etas: list[tuple[int, Fraction, list[tuple[int, Fraction]]]] = []
+        self.__refactor_interval: int = refactor_interval
+        self.__pivot_count: int = 0
+        # A refactor leaves one eta per structural basic column, so it is triggered
+        # by the pivots since then and not by the length of the eta file.
+        self.__pivots_since_refactor: int = 0
+        self.__refactor_count: int = 0
+
+    @property
+    def basis(self) -> list[int]:
+        return self.__basis
+
+    @property
+    def pivot_count(self) -> int:
+        return self.__pivot_count
+
+    @property
+    def refactor_count(self) -> int:
+        return self.__refactor_count
+
+    def __ftran(self, column: list[tuple[int, int]]) -> list[Fraction]:
+        # B^-1 a
+        result = [Fraction(0)] * len(self.__basis)
+        for row, value in column:
+            result[row] = Fraction(value)
+        for row, inverse_pivot, entries in self.__etas:
+            value = result[row]
+            if value == 0:
+                continue
+            result[row] = value * inverse_pivot
+            for i, entry in entries:
+                result[i] += entry * value
+        return result
+
+    def __btran(self, costs: list[Fraction]) -> list[Fraction]:
+        # c_B B^-1, applying the etas from the right in reverse order
+        result = list(costs)
+        for row, inverse_pivot, entries in reversed(self.__etas):
+            value = result[row] * inverse_pivot
+            for i, entry in entries:
+                if result[i] != 0:
+                    value += result[i] * entry
+            result[row] = value
+        return result
+
+    def __append_eta(self, row: int, direction: list[Fraction]) -> None:
+        pivot = direction[row]
+        entries = [(i, -d / pivot) for i, d in enumerate(direction) if i != row and d != 0]
+        self.__etas.append((row, 1 / pivot, entries))
+
+    def __refactor(self) -> None:
+        # Rebuild the eta file from the initial identity basis, so it stays
+        # as short as the number of structural columns in the basis.
+        initial = set(self.__form.initial_basis)
+        replaceable = initial - set(self.__basis)
+        self.__etas = []
+        basis = list(self.__form.initial_basis)
+        for column in self.__basis:
+            if column in initial:
+                continue
+            direction = self.__ftran(self.__form.columns[column])
+            row = next(i for i, d in enumerate(direction) if d != 0 and basis[i] in replaceable)
+            replaceable.discard(basis[row])
+            self.__append_eta(row, direction)
+            basis[row] = column
+        self.__basis = basis
+        self.__pivots_since_refactor = 0
+        self.__refactor_count += 1
+        self.__values = self.__ftran([(i, x) for i, x in enumerate(self.__form.rhs) if x != 0])
+
+    def __pivot(self, row: int, column: int, direction: list[Fraction]) -> None:
+        theta = self.__values[row] / direction[row]
+        if theta != 0:
+            for i, d in enumerate(direction):
+                if d != 0:
+                    self.__values[i] -= theta * d
+        self.__values[row] = theta
+        self.__basis[row] = column
+        self.__append_eta(row, direction)
+        self.__pivot_count += 1
+        self.__pivots_since_refactor += 1
+
+    def __reduced_cost(self, duals: list[Fraction], costs: list[int], column: int) -> Fraction:
+        return costs[column] - sum((duals[row] * value for row, value in self.__form.columns[column]), Fraction(0))
+
+    def __optimize(self, costs: list[int], allowed: list[int]) -> bool:
+        while True:
+            if self.__pivots_since_refactor > self.__refactor_interval:
+                self.__refactor()
+
+            duals = self.__btran([Fraction(costs[column]) for column in self.__basis])
+
+            basis = set(self.__basis)
+            pivot_column = -1
+            max_value = Fraction(0)
+            for column in allowed:
+                if column in basis:
+                    continue
+                reduced_cost = self.__reduced_cost(duals, costs, column)
+                if reduced_cost > max_value:
+                    pivot_column = column
+                    max_value = reduced_cost
+            if pivot_column < 0:
+                return True
+
+            direction = self.__ftran(self.__form.columns[pivot_column])
+            pivot_row = -1
+            min_ratio = Fraction(0)
+            for i, d in enumerate(direction):
+                if d <= 0:
+                    continue
+                ratio = self.__values[i] / d
+                if pivot_row < 0 or ratio < min_ratio:
+                    pivot_row = i
+                    min_ratio = ratio
+            if pivot_row < 0:
+                return False  # Unbound
+
+            self.__pivot(pivot_row, pivot_column, direction)
+
+    def __drive_out_artificials(self, artificials: set[int]) -> None:
+        # Swap artificials that are basic at zero for a real column. If the row
+        # has no real column left it is redundant and the artificial stays at zero.
+        for row in range(0, len(self.__basis)):
+            if self.__basis[row] not in artificials:
+                continue
+            unit = [Fraction(int(i == row)) for i in range(0, len(self.__basis))]
+            inverse_row = self.__btran(unit)
+            basis = set(self.__basis)
+            for column in range(0, len(self.__form.columns)):
+                if column in basis or column in artificials:
+                    continue
+                if sum((inverse_row[i] * value for i, value in self.__form.columns[column]), Fraction(0)) != 0:
+                    self.__pivot(row, column, self.__ftran(self.__form.columns[column]))
+                    break
+
+    def solve(self) -> tuple[Fraction, tuple[Fraction, ...]] | None:
+        form = self.__form
+        artificials = set(form.artificials)
+
+        if artificials:
+            # Phase I: drive the artificial variables to zero
+            costs = [-int(column in artificials) for column in range(0, len(form.columns))]
+            self.__optimize(costs, list(range(0, len(form.columns))))
+            if any(self.__values[i] != 0 for i, column in enumerate(self.__basis) if column in artificials):
+                return None  # Infeasible
+            self.__drive_out_artificials(artificials)
+
+        # Phase II: optimize the real profit without the artificial columns
+        allowed = [column for column in range(0, len(form.columns)) if column not in artificials]
+        if not self.__optimize(form.profit, allowed):
+            return None  # Unbound
+
+        variables = [Fraction(0)] * form.var_count
+        optimal_value = Fraction(0)
+        for column, value in zip(self.__basis, self.__values):
+            optimal_value += form.profit[column] * value
+            if column < form.var_count:
+                variables[column] = value
+        return optimal_value, tuple(variables)
+
+
+class BoundedSimplexTableau:
+    # Dense exact tableau with lower and upper bounds on every column. Nonbasic
+    # columns sit at one of their bounds. After the root is solved with the
+    # two-phase primal simplex the tableau stays dual feasible when a bound is
+    # tightened, so a copy can be re-optimised with a few dual simplex pivots.
+    def __init__(self, standard_form: SimplexStandardForm) -> None:
+        column_count = len(standard_form.profit)
+        self.__var_count: int = standard_form.var_count
+        self.__rows: list[list[Fraction]] = [[Fraction(x) for x in row] for row in standard_form.lhs]
+        self.__basis: list[int] = list(standard_form.initial_basis)
+        self.__values: list[Fraction] = [Fraction(0)] * column_count
+        for row_idx, column in enumerate(self.__basis):
+            self.__values[column] = Fraction(standard_form.rhs[row_idx])
+        self.__lower: list[int] = [0] * column_count
+        self.__upper: list[int | None] = [None] * column_count
+        self.__profit: list[int] = list(standard_form.profit)
+        self.__artificials: list[int] = list(standard_form.artificials)
+        self.__costs: list[int] = self.__profit
+        self.__reduced_costs: list[Fraction] = []
+        self.__pivot_count: int = 0
+
+    @property
+    def pivot_count(self) -> int:
+        return self.__pivot_count
+
+    def copy(self) -> "BoundedSimplexTableau":
+        tableau = copy(self)
+        tableau.__rows = [list(row) for row in self.__rows]
+        tableau.__basis = list(self.__basis)
+        tableau.__values = list(self.__values)
+        tableau.__lower = list(self.__lower)
+        tableau.__upper = list(self.__upper)
+        tableau.__reduced_costs = list(self.__reduced_costs)
+        return tableau
+
+    def __set_costs(self, costs: list[int]) -> None:
+        self.__costs = costs
+        reduced_costs = [Fraction(x) for x in costs]
+        for row, column in zip(self.__rows, self.__basis):
+            cost = costs[column]
+            if cost != 0:
+                reduced_costs = [x - cost * y for x, y in zip(reduced_costs, row)]
+        self.__reduced_costs = reduced_costs
+
+    def __step(self, pivot_row_idx: int, pivot_column_idx: int, theta: Fraction) -> None:
+        # Moves the entering column by theta, which moves every basic column
+        # along the pivot column, then pivots it into the basis.
+        if theta != 0:
+            self.__values[pivot_column_idx] += theta
+            for row, column in zip(self.__rows, self.__basis):
+                if row[pivot_column_idx] != 0:
+                    self.__values[column] -= row[pivot_column_idx] * theta
+
+        pivot_row = self.__rows[pivot_row_idx]
+        pivot_value = pivot_row[pivot_column_idx]
+        pivot_row = [x / pivot_value for x in pivot_row]
+        self.__rows[pivot_row_idx] = pivot_row
+
+        for row_idx, row in enumerate(self.__rows):
+            factor = row[pivot_column_idx]
+            if row_idx != pivot_row_idx and factor != 0:
+                self.__rows[row_idx] = [x - factor * y for x, y in zip(row, pivot_row)]
+
+        factor = self.__reduced_costs[pivot_column_idx]
+        if factor != 0:
+            self.__reduced_costs = [x - factor * y for x, y in zip(self.__reduced_costs, pivot_row)]
+
+        self.__basis[pivot_row_idx] = pivot_column_idx
+        self.__pivot_count += 1
+
+    def __primal_optimize(self) -> bool:
+        # Only used at the root, where every nonbasic column is at its lower bound
+        # and no column has an upper bound yet.
+        while True:
+            basis = set(self.__basis)
+            pivot_column_idx = -1
+            max_value = Fraction(0)
+            for i, reduced_cost in enumerate(self.__reduced_costs):
+                if reduced_cost > max_value and i not in basis:
+                    pivot_column_idx = i
+                    max_value = reduced_cost
+            if pivot_column_idx < 0:
+                return True
+
+            pivot_row_idx = -1
+            min_ratio = Fraction(0)
+            for i, (row, column) in enumerate(zip(self.__rows, self.__basis)):
+                if row[pivot_column_idx] <= 0:
+                    continue
+                ratio = (self.__values[column] - self.__lower[column]) / row[pivot_column_idx]
+                if pivot_row_idx < 0 or ratio < min_ratio:
+                    pivot_row_idx = i
+                    min_ratio = ratio
+            if pivot_row_idx < 0:
+                return False  # Unbound
+
+            self.__step(pivot_row_idx, pivot_column_idx, min_ratio)
+
+    def __drop_artificials(self) -> None:
+        artificials = set(self.__artificials)
+        redundant_rows: set[int] = set()
+        for row_idx, column in enumerate(self.__basis):
+            if column not in artificials:
+                continue
+            # Basic at zero: swap it for any real column, or drop the row if there is none
+            row = self.__rows[row_idx]
+            pivot_column_idx = next((i for i, x in enumerate(row) if x != 0 and i not in artificials), None)
+            if pivot_column_idx is None:
+                redundant_rows.add(row_idx)
+            else:
+                self.__step(row_idx, pivot_column_idx, Fraction(0))
+
+        kept_columns = [i for i in range(0, len(self.__values)) if i not in artificials]
+        new_index = {column: i for i, column in enumerate(kept_columns)}
+        self.__rows = [
+            [row[i] for i in kept_columns] for row_idx, row in enumerate(self.__rows) if row_idx not in redundant_rows
+        ]
+        self.__basis = [
+            new_index[column] for row_idx, column in enumerate(self.__basis) if row_idx not in redundant_rows
+        ]
+        self.__values = [self.__values[i] for i in kept_columns]
+        self.__lower = [self.__lower[i] for i in kept_columns]
+        self.__upper = [self.__upper[i] for i in kept_columns]
+        self.__profit = [self.__profit[i] for i in kept_columns]
+        self.__artificials = []
+
+    def solve(self) -> bool:
+        if self.__artificials:
+            # Phase I: drive the artificial variables to zero
+            artificials = set(self.__artificials)
+            self.__set_costs([-int(i in artificials) for i in range(0, len(self.__values))])
+            self.__primal_optimize()
+            if any(self.__values[i] != 0 for i in self.__artificials):
+                return False  # Infeasible
+            self.__drop_artificials()
+
+        # Phase II
+        self.__set_costs(self.__profit)
+        return self.__primal_optimize()
+
+    def set_lower_bound(self, column: int, bound: int) -> None:
+        self.__lower[column] = bound
+        self.__move_into_bounds(column)
+
+    def set_upper_bound(self, column: int, bound: int) -> None:
+        self.__upper[column] = bound
+        self.__move_into_bounds(column)
+
+    def __move_into_bounds(self, column: int) -> None:
+        # A nonbasic column outside its new bounds moves onto the violated bound,
+        # dragging the basic columns with it. Basic columns are fixed by reoptimize().
+        if column in self.__basis:
+            return
+        value = self.__values[column]
+        upper = self.__upper[column]
+        if value < self.__lower[column]:
+            delta = self.__lower[column] - value
+        elif upper is not None and value > upper:
+            delta = upper - value
+        else:
+            return
+
+        self.__values[column] += delta
+        for row, basic_column in zip(self.__rows, self.__basis):
+            if row[column] != 0:
+                self.__values[basic_column] -= row[column] * delta
+
+    def reoptimize(self) -> bool:
+        # Dual simplex: the reduced costs stay optimal, the basic column with the
+        # largest bound violation leaves at that bound.
+        while True:
+            pivot_row_idx = -1
+            max_violation = Fraction(0)
+            for i, column in enumerate(self.__basis):
+                value = self.__values[column]
+                upper = self.__upper[column]
+                violation = self.__lower[column] - value
+                if upper is not None and value - upper > violation:
+                    violation = value - upper
+                if violation > max_violation:
+                    pivot_row_idx = i
+                    max_violation = violation
+            if pivot_row_idx < 0:
+                return True
+
+            leaving = self.__basis[pivot_row_idx]
+            increase = self.__values[leaving] < self.__lower[leaving]
+            target = self.__lower[leaving] if increase else self.__upper[leaving]
+            assert target is not None
+
+            # The entering column has to move the leaving one towards its bound
+            # while keeping every reduced cost on the optimal side.
+            row = self.__rows[pivot_row_idx]
+            basis = set(self.__basis)
+            pivot_column_idx = -1
+            min_ratio = Fraction(0)
+            for i, alpha in enumerate(row):
+                if alpha == 0 or i in basis or self.__lower[i] == self.__upper[i]:
+                    continue
+                at_upper = self.__upper[i] is not None and self.__values[i] == self.__upper[i]
+                if increase == at_upper:
+                    if alpha < 0:
+                        continue
+                elif alpha > 0:
+                    continue
+
+                ratio = abs(self.__reduced_costs[i] / alpha)
+                if pivot_column_idx < 0 or ratio < min_ratio:
+                    pivot_column_idx = i
+                    min_ratio = ratio
+            if pivot_column_idx < 0:
+                return False  # Infeasible
+
+            self.__step(pivot_row_idx, pivot_column_idx, (self.__values[leaving] - target) / row[pivot_column_idx])
+
+    def add_gomory_cut(self) -> bool:
+        # Fractional Gomory cut sum(frac(a_j) * x_j) >= frac(b) from the row of the
+        # most fractional basic variable, added with its own slack column. It only
+        # holds while every nonbasic column is at zero, which is the case at the
+        # root, and relies on every column (slacks included) being integral.
+        basis = set(self.__basis)
+        if any(value != 0 for i, value in enumerate(self.__values) if i not in basis):
+            return False
+
+        cut_row_idx = -1
+        min_distance = Fraction(0)
+        for i, column in enumerate(self.__basis):
+            if column >= self.__var_count or self.__values[column].is_integer():
+                continue
+            distance = abs(self.__values[column] - floor(self.__values[column]) - Fraction(1, 2))
+            if cut_row_idx < 0 or distance < min_distance:
+                cut_row_idx = i
+                min_distance = distance
+        if cut_row_idx < 0:
+            return False
+
+        value = self.__values[self.__basis[cut_row_idx]]
+        cut = [Fraction(0) if i in basis else floor(x) - x for i, x in enumerate(self.__rows[cut_row_idx])]
+        cut.append(Fraction(1))
+        for row in self.__rows:
+            row.append(Fraction(0))
+        self.__rows.append(cut)
+
+        # The new slack starts basic at -frac(b), reoptimize() restores feasibility
+        self.__basis.append(len(self.__values))
+        self.__values.append(floor(value) - value)
+        self.__lower.append(0)
+        self.__upper.append(None)
+        self.__profit.append(0)
+        self.__reduced_costs.append(Fraction(0))
+        return True
+
+    def get_solution(self) -> tuple[Fraction, tuple[Fraction, ...]]:  # Optimal Value, (x1, x2, ...)
+        optimal_value = sum(
+            (cost * value for cost, value in zip(self.__profit, self.__values) if cost != 0), Fraction(0)
+        )
+        return optimal_value, tuple(self.__values[0 : self.__var_count])
+
+
+@dataclass
+class BranchAndBoundStats:
+    nodes: int = 0
+    pruned: int = 0
+    infeasible: int = 0
+    incumbents: int = 0
+    cuts: int = 0
+    pivots: int = 0
+    root_time: float = 0.0
+    search_time: float = 0.0
+
+    def add_counts(self, other: "BranchAndBoundStats") -> None:
+        self.nodes += other.nodes
+        self.pruned += other.pruned
+        self.infeasible += other.infeasible
+        self.incumbents += other.incumbents
+        self.cuts += other.cuts
+        self.pivots += other.pivots
+
+
+BoundChange = tuple[int, int, bool]  # Variable, Bound, Is upper bound
+# The tableau already has every bound change from the root applied, but still has to be re-optimised
+BranchAndBoundNode = tuple[BoundedSimplexTableau, tuple[BoundChange, ...]]
+
+
+class BranchAndBoundNodes:
+    # Open nodes keyed by the bound of their parent. Depth first pops the newest
+    # node, best bound the one with the highest bound (the newest one on ties).
+    def __init__(self, best_bound: bool) -> None:
+        self.__best_bound: bool = best_bound
+        self.__nodes: list[tuple[tuple[Fraction, int], Fraction, BranchAndBoundNode]] = []
+        self.__sequence: int = 0
+
+    def __key(self, bound: Fraction, sequence: int) -> tuple[Fraction, int]:
+        return (-bound if self.__best_bound else Fraction(0)), -sequence
+
+    def push(self, bound: Fraction, node: BranchAndBoundNode) -> None:
+        self.__sequence += 1
+        heapq.heappush(self.__nodes, (self.__key(bound, self.__sequence), bound, node))
+
+    def pop(self) -> tuple[Fraction, BranchAndBoundNode]:
+        _, bound, node = heapq.heappop(self.__nodes)
+        return bound, node
+
+    def use_best_bound(self) -> None:
+        if self.__best_bound:
+            return
+        self.__best_bound = True
+        self.__nodes = [(self.__key(bound, -key[1]), bound, node) for key, bound, node in self.__nodes]
+        heapq.heapify(self.__nodes)
+
+    def __len__(self) -> int:
+        return len(self.__nodes)
+
+
+class SharedIncumbent:
+    # Objective of the best integer solution any process has found so far.
+    # Stored as an int64, values that do not fit are simply not shared.
+    __NONE = -(2**63)
+
+    def __init__(self, value: int | None = None) -> None:
+        self.__value = Value("q", self.__NONE)
+        if value is not None:
+            self.offer(value)
+
+    @property
+    def value(self) -> int | None:
+        value = self.__value.value
+        return None if value == self.__NONE else value
+
+    def offer(self, value: int) -> None:
+        if not self.__NONE < value < 2**63:
+            return
+        with self.__value.get_lock():
+            if value > self.__value.value:
+                self.__value.value = value
+
+
+def find_branching_variable(variables: tuple[Fraction, ...]) -> int | None:
+    max_idx = -1
+    max_value = Fraction(0)
+    for i, value in enumerate(variables):
+        if value.is_integer():
+            continue
+
+        if max_idx < 0 or value > max_value:
+            max_value = value
+            max_idx = i
+
+    return max_idx if max_idx >= 0 else None
+
+
+def solve_root_relaxation(tableau: BoundedSimplexTableau, gomory_cuts: int, stats: BranchAndBoundStats) -> bool:
+    feasible = tableau.solve()
+    for _ in range(0, gomory_cuts):
+        if not feasible or not tableau.add_gomory_cut():
+            break
+        stats.cuts += 1
+        feasible = tableau.reoptimize()
+    stats.pivots += tableau.pivot_count
+    return feasible
+
+
+class BranchAndBoundSearch:
+    # Warm started branch and bound: every node owns its tableau, the floor child
+    # gets a copy of the parent, the ceil child takes over the parent itself.
+    # The profit is integral, so only nodes whose floor(bound) beats the incumbent
+    # are worth exploring. A shared incumbent only prunes nodes strictly below it,
+    # so a subproblem still finds its own first optimal solution regardless of
+    # what other processes found, which keeps parallel results deterministic.
+    def __init__(
+        self, node_selection: NodeSelection, stats: BranchAndBoundStats, incumbent: SharedIncumbent | None = None
+    ) -> None:
+        self.__nodes = BranchAndBoundNodes(node_selection == NodeSelection.BEST_BOUND)
+        self.__hybrid: bool = node_selection == NodeSelection.HYBRID
+        self.__stats: BranchAndBoundStats = stats
+        self.__incumbent: SharedIncumbent | None = incumbent
+        self.__lower_bound: int | None = None
+        self.__lower_bound_solution: tuple[Fraction, ...] = ()
+
+    @property
+    def result(self) -> tuple[int, tuple[Fraction, ...]] | None:
+        if self.__lower_bound is None:
+            return None  # No integer solution
+        return self.__lower_bound, self.__lower_bound_solution
+
+    def push(self, bound: Fraction, tableau: BoundedSimplexTableau, bound_changes: tuple[BoundChange, ...]) -> None:
+        self.__nodes.push(bound, (tableau, bound_changes))
+
+    def __is_pruned(self, bound: Fraction) -> bool:
+        if self.__lower_bound is not None and floor(bound) <= self.__lower_bound:
+            return True
+        shared_bound = self.__incumbent.value if self.__incumbent is not None else None
+        return shared_bound is not None and floor(bound) < shared_bound
+
+    def run(self, max_open_nodes: int | None = None) -> None:
+        stats = self.__stats
+        while self.__nodes:
+            if max_open_nodes is not None and len(self.__nodes) >= max_open_nodes:
+                return
+
+            bound, (tableau, bound_changes) = self.__nodes.pop()
+            if self.__is_pruned(bound):
+                stats.pruned += 1
+                continue
+
+            stats.nodes += 1
+            pivot_count = tableau.pivot_count
+            feasible = tableau.reoptimize()
+            stats.pivots += tableau.pivot_count - pivot_count
+            if not feasible:
+                stats.infeasible += 1
+                continue
+
+            solution_value, variables = tableau.get_solution()
+            if self.__is_pruned(solution_value):
+                stats.pruned += 1
+                continue
+
+            branch_idx = find_branching_variable(variables)
+            if branch_idx is None:
+                stats.incumbents += 1
+                self.__lower_bound = int(solution_value)
+                self.__lower_bound_solution = variables
+                if self.__incumbent is not None:
+                    self.__incumbent.offer(self.__lower_bound)
+                if self.__hybrid:
+                    self.__nodes.use_best_bound()
+                continue
+
+            floor_bound = floor(variables[branch_idx])
+            floor_tableau = tableau.copy()
+            floor_tableau.set_upper_bound(branch_idx, floor_bound)
+            tableau.set_lower_bound(branch_idx, floor_bound + 1)
+            self.push(solution_value, tableau, bound_changes + ((branch_idx, floor_bound + 1, False),))
+            self.push(solution_value, floor_tableau, bound_changes + ((branch_idx, floor_bound, True),))
+
+    def pop_open_nodes(self) -> list[tuple[Fraction, tuple[BoundChange, ...]]]:
+        open_nodes = []
+        while self.__nodes:
+            bound, (_, bound_changes) = self.__nodes.pop()
+            if self.__is_pruned(bound):
+                self.__stats.pruned += 1
+            else:
+                open_nodes.append((bound, bound_changes))
+        return open_nodes
+
+
+# The tree is always split into the same subproblems, so the result does not depend on the process count
+PARALLEL_SUBPROBLEMS = 64
+
+# Every worker of a parallel search solves the root once and then only receives bound changes
+_subproblem_root: BoundedSimplexTableau | None = None
+_subproblem_incumbent: SharedIncumbent | None = None
+
+
+def _init_subproblem_worker(
+    profit: tuple[int, ...], constraints: list[SimplexConstraint], gomory_cuts: int, incumbent: SharedIncumbent
+) -> None:
+    global _subproblem_root, _subproblem_incumbent
+    _subproblem_root = BoundedSimplexTableau(SimplexStandardForm.build(profit, constraints))
+    solve_root_relaxation(_subproblem_root, gomory_cuts, BranchAndBoundStats())
+    _subproblem_incumbent = incumbent
+
+
+def _solve_subproblem(
+    subproblem: tuple[Fraction, tuple[BoundChange, ...], NodeSelection],
+) -> tuple[tuple[int, tuple[Fraction, ...]] | None, BranchAndBoundStats]:
+    bound, bound_changes, node_selection = subproblem
+    assert _subproblem_root is not None
+
+    tableau = _subproblem_root.copy()
+    for branch_idx, value, is_upper in bound_changes:
+        if is_upper:
+            tableau.set_upper_bound(branch_idx, value)
+        else:
+            tableau.set_lower_bound(branch_idx, value)
+
+    stats = BranchAndBoundStats()
+    search = BranchAndBoundSearch(node_selection, stats, _subproblem_incumbent)
+    search.push(bound, tableau, bound_changes)
+    search.run()
+    return search.result, stats
+
+
 class Simplex:
     def __init__(self, profit: tuple[int, ...]) -> None:
         self.__profit: tuple[int, ...] = profit
         self.__constraints: list[SimplexConstraint] = []
         self.__branch_and_bound_constraints: list[SimplexConstraint] = []
+        self.__stats: BranchAndBoundStats = BranchAndBoundStats()
 
     @property
     def profit(self) -> tuple[int, ...]:
@@ -183,6 +1244,11 @@ class Simplex:
     def constraints(self) -> list[SimplexConstraint]:
         return self.__constraints
 
+    @property
+    def stats(self) -> BranchAndBoundStats:
+        # Of the last warm started solve_integer()
+        return self.__stats
+
     def addLEqConsraint(self, lhs: list[int], rhs: int) -> None:
         new_constraint = SimplexConstraint(type_=SimplexConstraintType.LEQ, lhs=tuple(lhs), rhs=rhs)
         self.__constraints.append(new_constraint)
@@ -206,66 +1272,162 @@ class Simplex:
 
     def __find_pivot_row(self, tableau: SimplexTableau, pivot_column: int) -> int | None:
         pivot_row = -1
-        min_value = BigM
+        min_value = Fraction(0)
         for i, row in enumerate(tableau.rows):
             divisor = tableau.rows[i].lhs[pivot_column]
             if divisor <= 0:
                 continue
 
             ratio = row.rhs / divisor
-            if ratio < min_value:
+            if pivot_row < 0 or ratio < min_value:
                 pivot_row = i
                 min_value = ratio
 
         return pivot_row if pivot_row >= 0 else None
 
-    def solve(self) -> tuple[Fraction, tuple[Fraction, ...]] | None:
-        tableau = SimplexTableau(self.__profit, self.__constraints + self.__branch_and_bound_constraints)
-
+    def __optimize(self, tableau: SimplexTableau) -> bool:
         while (pivot_column_idx := self.__find_pivot_column(tableau)) is not None:
             pivot_row_idx = self.__find_pivot_row(tableau, pivot_column_idx)
             if pivot_row_idx is None:
-                return None  # Unbound
-
-            # Replace Basic variable
-            tableau.set_basic_variable(pivot_row_idx, pivot_column_idx)
-
-            # Pivot the Row
-            pivot_value: Fraction = tableau.rows[pivot_row_idx].lhs[pivot_column_idx]
-            tableau.rows[pivot_row_idx] /= pivot_value
-
-            # Pivot the Column
-            for row_idx, row in enumerate(tableau.rows):
-                if row_idx == pivot_row_idx:
-                    continue
-                factor = row.lhs[pivot_column_idx]
-                row -= factor * tableau.rows[pivot_row_idx]
+                return False  # Unbound
+
+            tableau.pivot(pivot_row_idx, pivot_column_idx)
+        return True
+
+    def __solve_numpy(
+        self, constraints: list[SimplexConstraint]
+    ) -> tuple[bool, tuple[Fraction, tuple[Fraction, ...]] | None]:  # Confirmed, Result
+        standard_form = SimplexStandardForm.build(self.__profit, constraints)
+        tableau = NumpySimplexTableau(standard_form)
+        if tableau.solve():
+            solve_result = standard_form.verify_basis(tableau.basis)
+            return solve_result is not None, solve_result
+        if tableau.infeasible and standard_form.verify_infeasible(tableau.basis):
+            return True, None
+        return False, None
+
+    def solve(self, backend: SimplexBackend = SimplexBackend.FRACTION) -> tuple[Fraction, tuple[Fraction, ...]] | None:
+        constraints = self.__constraints + self.__branch_and_bound_constraints
+
+        if backend == SimplexBackend.REVISED:
+            return RevisedSimplex(SparseStandardForm.build(self.__profit, constraints)).solve()
+
+        if backend == SimplexBackend.NUMPY:
+            # Only trusted once the basis is confirmed exactly, otherwise fall back to fractions
+            confirmed, solve_result = self.__solve_numpy(constraints)
+            if confirmed:
+                return solve_result
+
+        tableau = SimplexTableau(self.__profit, constraints)
+
+        if tableau.artificial_count > 0:
+            # Phase I is bounded by zero, afterwards the artificials are dropped
+            self.__optimize(tableau)
+            if not tableau.drop_artificials():
+                return None  # Infeasible
+
+        if not self.__optimize(tableau):
+            return None  # Unbound
 
         return tableau.get_solution()
 
     def __find_branch_and_bound_constraints(
         self, variables: tuple[Fraction, ...]
     ) -> tuple[SimplexConstraint, SimplexConstraint] | None:
-        max_idx = -1
-        max_value = -BigM
-        for i, value in enumerate(variables):
-            if value.is_integer():
-                continue
-
-            if value > max_value:
-                max_value = value
-                max_idx = i
-
-        if max_idx < 0:
+        max_idx = find_branching_variable(variables)
+        if max_idx is None:
             return None
+        max_value = variables[max_idx]
 
         filter_var = tuple([int(x == max_idx) for x in range(0, len(variables))])
         new_constraint_floor = SimplexConstraint(SimplexConstraintType.LEQ, lhs=filter_var, rhs=floor(max_value))
         new_constraint_ceil = SimplexConstraint(SimplexConstraintType.GEQ, lhs=filter_var, rhs=ceil(max_value))
         return new_constraint_floor, new_constraint_ceil
 
-    def solve_integer(self) -> tuple[Fraction, tuple[Fraction, ...]] | None:
-        solve_result = self.solve()
+    def __solve_integer_warm_start(
+        self, node_selection: NodeSelection, gomory_cuts: int, processes: int
+    ) -> tuple[Fraction, tuple[Fraction, ...]] | None:
+        stats = BranchAndBoundStats()
+        self.__stats = stats
+        start = perf_counter()
+
+        tableau = BoundedSimplexTableau(SimplexStandardForm.build(self.__profit, self.__constraints))
+        feasible = solve_root_relaxation(tableau, gomory_cuts, stats)
+        stats.root_time = perf_counter() - start
+        if not feasible:
+            return None
+
+        start = perf_counter()
+        root_bound, _ = tableau.get_solution()
+        if processes <= 1:
+            search = BranchAndBoundSearch(node_selection, stats)
+            search.push(root_bound, tableau, ())
+            search.run()
+            results = [search.result]
+        else:
+            results = self.__run_parallel_search(root_bound, tableau, node_selection, gomory_cuts, processes)
+        stats.search_time = perf_counter() - start
+
+        # The first of the best results in submission order, independent of the worker timing
+        best_result: tuple[int, tuple[Fraction, ...]] | None = None
+        for result in results:
+            if result is not None and (best_result is None or result[0] > best_result[0]):
+                best_result = result
+        if best_result is None:
+            return None  # No integer solution
+        return Fraction(best_result[0]), best_result[1]
+
+    def __run_parallel_search(
+        self,
+        root_bound: Fraction,
+        tableau: BoundedSimplexTableau,
+        node_selection: NodeSelection,
+        gomory_cuts: int,
+        processes: int,
+    ) -> list[tuple[int, tuple[Fraction, ...]] | None]:
+        # Expand the tree best bound first until there are enough subproblems to
+        # keep the workers busy, then send each open node to the pool as its bound
+        # changes from the root.
+        search = BranchAndBoundSearch(NodeSelection.BEST_BOUND, self.__stats)
+        search.push(root_bound, tableau, ())
+        search.run(max_open_nodes=PARALLEL_SUBPROBLEMS)
+        results = [search.result]
+
+        subproblems = search.pop_open_nodes()
+        if not subproblems:
+            return results
+
+        # The hybrid dive is only there to find an early incumbent, the shared one already provides that
+        if node_selection == NodeSelection.HYBRID:
+            node_selection = NodeSelection.BEST_BOUND
+
+        incumbent = SharedIncumbent(results[0][0] if results[0] is not None else None)
+        initargs = (self.__profit, self.__constraints, gomory_cuts, incumbent)
+        with Pool(processes, initializer=_init_subproblem_worker, initargs=initargs) as pool:
+            tasks = [(bound, bound_changes, node_selection) for bound, bound_changes in subproblems]
+            for result, stats in pool.imap(_solve_subproblem, tasks):
+                results.append(result)
+                self.__stats.add_counts(stats)
+        return results
+
+    def solve_integer(
+        self,
+        backend: SimplexBackend = SimplexBackend.FRACTION,
+        warm_start: bool = True,
+        node_selection: NodeSelection = NodeSelection.DEPTH_FIRST,
+        gomory_cuts: int = 0,
+        processes: int | None = 1,
+    ) -> tuple[Fraction, tuple[Fraction, ...]] | None:
+        # The warm started search re-optimises child nodes from their parent with
+        # the dual simplex in exact arithmetic, so it only serves the FRACTION backend;
+        # other backends solve every node from scratch with the depth first search.
+        # With more than one process (None for all CPUs) the tree is searched in parallel.
+        if warm_start and backend == SimplexBackend.FRACTION:
+            return self.__solve_integer_warm_start(node_selection, gomory_cuts, processes or os.cpu_count() or 1)
+        if node_selection != NodeSelection.DEPTH_FIRST or gomory_cuts or processes != 1:
+            raise ValueError("node selection, Gomory cuts and processes need the warm started FRACTION backend")
+
+        solve_result = self.solve(backend)
         if solve_result is None:
             return None
         solution_value, variables = solve_result
@@ -279,17 +1441,17 @@ class Simplex:
 
         constraints_stack: list[list[SimplexConstraint]] = [[extra_constraints[1]], [extra_constraints[0]]]
 
-        lower_bound: Fraction = Fraction(-BigM)
+        lower_bound: Fraction | None = None
         lower_bound_solution: tuple[Fraction, ...] = ()
         while constraints_stack:
             self.__branch_and_bound_constraints = constraints_stack.pop()
 
-            solve_result = self.solve()
+            solve_result = self.solve(backend)
             if solve_result is None:
                 continue
             solution_value, variables = solve_result
 
-            if solution_value <= lower_bound:
+            if lower_bound is not None and floor(solution_value) <= lower_bound:
                 continue
 
             if all(x.is_integer() for x in variables):
@@ -302,6 +1464,8 @@ class Simplex:
                     constraints_stack.append(self.__branch_and_bound_constraints + [new_constraints[0]])
 
         self.__branch_and_bound_constraints = []
+        if lower_bound is None:
+            return None  # No integer solution
         return lower_bound, lower_bound_solution
 
     def __str__(self) -> str:
@@ -1,7 +1,15 @@
 import unittest
 from pathlib import Path
 
-from aoc2025.day02 import read_file, check_ids, check_ids_regex, check_ids_2, check_ids_2_regex
+from aoc2025.day02 import (
+    read_file,
+    check_ids,
+    check_ids_regex,
+    check_ids_arithmetic,
+    check_ids_2,
+    check_ids_2_regex,
+    check_ids_2_arithmetic,
+)
 
 
 TEST_INPUT = [
@@ -27,7 +35,7 @@ class TestDay02(unittest.TestCase):
         self.assertListEqual(content, TEST_INPUT)
 
     def test_phase1(self):
-        for func in [check_ids, check_ids_regex]:
+        for func in [check_ids, check_ids_regex, check_ids_arithmetic]:
             test_cases = [
                 (TEST_INPUT[0], 11 + 22),
                 (TEST_INPUT[1], 99),
@@ -50,7 +58,7 @@ class TestDay02(unittest.TestCase):
             self.assertEqual(password, 1227775554)
 
     def test_phase2(self):
-        for func in [check_ids_2, check_ids_2_regex]:
+        for func in [check_ids_2, check_ids_2_regex, check_ids_2_arithmetic]:
             test_cases = [
                 (TEST_INPUT[0], 11 + 22),
                 (TEST_INPUT[1], 99 + 111),
@@ -77,8 +85,24 @@ class TestDay02(unittest.TestCase):
         self.assertEqual(result, 1227775554)
         result = check_ids_regex(read_file(TEST_FILE))
         self.assertEqual(result, 1227775554)
+        result = check_ids_arithmetic(read_file(TEST_FILE))
+        self.assertEqual(result, 1227775554)
 
         result = check_ids_2(read_file(TEST_FILE))
         self.assertEqual(result, 4174379265)
         result = check_ids_2_regex(read_file(TEST_FILE))
         self.assertEqual(result, 4174379265)
+        result = check_ids_2_arithmetic(read_file(TEST_FILE))
+        self.assertEqual(result, 4174379265)
+
+    def test_arithmetic_matches_scan(self):
+        test_cases = [(1, 1), (1, 9), (1, 10000), (5, 123456), (999, 120000), (101010, 222222)]
+        for data in test_cases:
+            with self.subTest(data=data):
+                self.assertEqual(check_ids_arithmetic([data]), check_ids([data]))
+                self.assertEqual(check_ids_2_arithmetic([data]), check_ids_2([data]))
+
+    def test_arithmetic_wide_range(self):
+        result = check_ids_arithmetic([(1, 10**8 - 1)])
+        expected = sum(block * (10 ** len(str(block)) + 1) for block in range(1, 10**4))
+        self.assertEqual(result, expected)
@@ -1,7 +1,21 @@
 import pytest
 from pathlib import Path
 
-from aoc2025.day04 import read_file, check_storage_location_safe, is_forkliftable, find_forkliftable_spots, remove_paper, clean_up_warehouse
+from aoc2025.day04 import (
+    read_file,
+    read_file_packed,
+    check_storage_location_safe,
+    is_forkliftable,
+    find_forkliftable_spots,
+    remove_paper,
+    clean_up_warehouse,
+    clean_up_warehouse_rounds,
+    pack_warehouse,
+    unpack_warehouse,
+    count_neighbours,
+    find_forkliftable_spots_packed,
+    clean_up_packed_warehouse,
+)
 
 
 TEST_FILE = Path(__file__).parent / "data" / "day04.txt"
@@ -113,3 +127,46 @@ def test_clean_up_warehouse(warehouse):
 
     assert papers_removed == 43
     assert warehouse == expected
+
+
+def test_pack_warehouse(warehouse):
+    packed = pack_warehouse(warehouse)
+    assert packed == read_file_packed(TEST_FILE)
+    assert unpack_warehouse(packed) == warehouse
+
+
+def test_count_neighbours(warehouse):
+    packed = pack_warehouse(warehouse)
+    counts = count_neighbours(packed)
+    assert counts[packed.index(0, 0)] == 2
+    assert counts[packed.index(3, 3)] == 7
+    assert counts[packed.index(9, 9)] == 2
+
+
+def test_find_forkliftable_spots_packed(warehouse):
+    result = find_forkliftable_spots_packed(pack_warehouse(warehouse))
+    assert result == find_forkliftable_spots(warehouse)
+
+
+def test_clean_up_packed_warehouse(warehouse):
+    packed = pack_warehouse(warehouse)
+    papers_removed = clean_up_packed_warehouse(packed)
+
+    assert papers_removed == clean_up_warehouse(warehouse)
+    assert unpack_warehouse(packed) == warehouse
+
+
+def test_clean_up_warehouse_rounds(warehouse):
+    rounds = list(clean_up_warehouse_rounds(warehouse))
+
+    assert rounds == [13, 12, 7, 5, 2, 1, 1, 1, 1]
+
+
+def test_clean_up_warehouse_incremental(warehouse):
+    expected_warehouse = [row.copy() for row in warehouse]
+    expected = clean_up_warehouse(expected_warehouse)
+
+    papers_removed = clean_up_warehouse(warehouse, incremental=True)
+
+    assert papers_removed == expected
+    assert warehouse == expected_warehouse
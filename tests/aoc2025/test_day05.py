@@ -2,12 +2,15 @@ import pytest
 from pathlib import Path
 
 from aoc2025.day05 import (
+    FreshIdIndex,
     FreshIdRange,
+    build_fresh_id_set,
     Ingredient,
     count_all_fresh_ingredients,
     find_fresh_ingredients,
     optimize_fresh_id_ranges,
     count_available_fresh_ingredients,
+    count_available_fresh_ingredients_streaming,
     read_file,
 )
 
@@ -83,3 +86,51 @@ def test_count_fresh_ingredients(optimized_fresh_id_ranges):
     result = count_all_fresh_ingredients(optimized_fresh_id_ranges)
 
     assert result == 14
+
+
+def test_fresh_id_index(fresh_id_ranges, optimized_fresh_id_ranges):
+    index = FreshIdIndex(fresh_id_ranges)
+
+    assert len(index) == 2
+    assert index.ranges() == optimized_fresh_id_ranges
+    assert index.count_all_fresh() == 14
+
+
+@pytest.mark.parametrize("ingredient,expected",
+                         [
+                                (2, False),
+                                (3, True),
+                                (5, True),
+                                (6, False),
+                                (10, True),
+                                (20, True),
+                                (21, False),
+                         ])
+def test_fresh_id_index_contains(fresh_id_ranges, ingredient, expected):
+    index = FreshIdIndex(fresh_id_ranges)
+    assert (Ingredient(ingredient) in index) == expected
+
+
+def test_fresh_id_index_count_fresh(fresh_id_ranges, ingredients):
+    index = FreshIdIndex(fresh_id_ranges)
+
+    assert index.count_fresh(ingredients) == 3
+    assert index.count_fresh_sorted(sorted(ingredients)) == 3
+    assert index.count_fresh_sorted(iter([Ingredient(x) for x in range(0, 30)])) == 14
+
+
+def test_count_available_fresh_ingredients_streaming(optimized_fresh_id_ranges, ingredients):
+    fresh_id_index, result = count_available_fresh_ingredients_streaming(TEST_FILE)
+
+    assert fresh_id_index.ranges() == optimized_fresh_id_ranges
+    assert result == count_available_fresh_ingredients(optimized_fresh_id_ranges, ingredients)
+
+
+def test_build_fresh_id_set(fresh_id_ranges, optimized_fresh_id_ranges):
+    fresh_id_set = build_fresh_id_set(fresh_id_ranges)
+
+    assert [FreshIdRange(*x) for x in fresh_id_set] == optimized_fresh_id_ranges
+    assert count_all_fresh_ingredients(fresh_id_set) == 14
+
+    fresh_id_set.add(6, 9)
+    assert count_all_fresh_ingredients(fresh_id_set) == 18
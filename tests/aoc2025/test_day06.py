@@ -0,0 +1,87 @@
+import pytest
+from pathlib import Path
+
+from aoc2025.day06 import (
+    Problem,
+    calculate_problems,
+    calculate_worksheet,
+    calculate_worksheet_stream,
+    evaluate_problems,
+    generate_problems_phase2,
+    pack_worksheet,
+    parse_worksheet_phase1,
+    parse_worksheet_phase2,
+    read_file,
+    read_worksheet,
+)
+
+
+TEST_FILE = Path(__file__).parent / "data" / "day06.txt"
+
+
+@pytest.fixture
+def content() -> list[str]:
+    return [
+        "123 328  51 64 ",
+        " 45 64  387 23 ",
+        "  6 98  215 314",
+        "*   +   *   + ",
+    ]
+
+
+def test_read_file(content):
+    assert read_file(TEST_FILE) == content
+
+
+def test_parse_worksheet_phase1(content):
+    expected = [
+        Problem("*", [123, 45, 6]),
+        Problem("+", [328, 64, 98]),
+        Problem("*", [51, 387, 215]),
+        Problem("+", [64, 23, 314]),
+    ]
+    assert parse_worksheet_phase1(content) == expected
+
+
+def test_parse_worksheet_phase2(content):
+    expected = [
+        Problem("*", [1, 24, 356]),
+        Problem("+", [369, 248, 8]),
+        Problem("*", [32, 581, 175]),
+        Problem("+", [623, 431, 4]),
+    ]
+    assert parse_worksheet_phase2(content) == expected
+
+
+def test_calculate_problems(content):
+    assert sum(calculate_problems(parse_worksheet_phase1(content))) == 4277556
+    assert sum(calculate_problems(parse_worksheet_phase2(content))) == 3263827
+
+
+def test_read_worksheet(content):
+    worksheet = read_worksheet(TEST_FILE)
+
+    assert worksheet == pack_worksheet([line.encode() for line in content])
+    assert worksheet.width == 15
+    assert worksheet.height == 4
+
+
+def test_calculate_worksheet(content):
+    worksheet = pack_worksheet([line.rstrip().encode() for line in content])
+
+    assert calculate_worksheet(worksheet) == (4277556, 3263827)
+
+
+@pytest.mark.parametrize("block_width", [1, 2, 3, 4, 7, 15, 100])
+def test_calculate_worksheet_stream(block_width):
+    with open(TEST_FILE, "rb") as f:
+        result = calculate_worksheet_stream(f, block_width)
+
+    assert result == (4277556, 3263827)
+
+
+def test_evaluate_problems(content):
+    answers = evaluate_problems(generate_problems_phase2(content))
+
+    assert next(answers) == 8544
+    assert sum(answers) == 3263827 - 8544
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from aoc2025.day07 import beam_tracer, quantum_beam_tracer, read_file, trace_timelines, trace_timelines_file
+
+
+TEST_FILE = Path(__file__).parent / "data" / "day07.txt"
+
+
+def test_beam_tracer():
+    _, split_count = beam_tracer(read_file(TEST_FILE))
+    assert split_count == 21
+
+
+def test_quantum_beam_tracer():
+    _, timelines_count = quantum_beam_tracer(read_file(TEST_FILE))
+    assert timelines_count == 40
+
+
+def test_trace_timelines_file():
+    assert trace_timelines_file(TEST_FILE) == (21, 40)
+
+
+def test_trace_timelines():
+    lines = [
+        "..S..",
+        ".....",
+        "..^..",
+        ".^...",
+    ]
+    assert trace_timelines(lines) == (2, 3)
@@ -0,0 +1,156 @@
+import pytest
+import random
+from itertools import islice
+from pathlib import Path
+
+from aoc2025.day08 import (
+    JunctionBox,
+    JunctionBoxTree,
+    SortedConnections,
+    calculate_distances,
+    count_circuit_sizes,
+    find_spanning_tree,
+    find_nearest_pairs_numpy,
+    find_spanning_pairs,
+    find_spanning_tree_spatial,
+    generate_nearest_pairs,
+    make_shortest_connections,
+    make_shortest_connections_numpy,
+    make_shortest_connections_spatial,
+    phase2,
+    read_file,
+    to_connection,
+)
+
+
+TEST_FILE = Path(__file__).parent / "data" / "day08.txt"
+
+
+@pytest.fixture
+def junction_boxes() -> list[JunctionBox]:
+    return read_file(TEST_FILE)
+
+
+def test_read_file(junction_boxes):
+    assert len(junction_boxes) == 20
+    assert junction_boxes[0] == JunctionBox(162, 817, 812)
+
+
+def test_phase1(junction_boxes):
+    circuits, _ = make_shortest_connections(calculate_distances(junction_boxes), 10)
+    assert count_circuit_sizes(circuits, 3) == 40
+
+
+def test_phase2(junction_boxes):
+    _, spanning_tree = find_spanning_tree(junction_boxes, calculate_distances(junction_boxes))
+    assert phase2(spanning_tree) == 25272
+
+
+def test_generate_nearest_pairs(junction_boxes):
+    pairs = list(generate_nearest_pairs(junction_boxes))
+    connections = sorted(calculate_distances(junction_boxes))
+
+    assert len(pairs) == len(connections)
+    assert [(junction_boxes[i], junction_boxes[j]) for _, i, j in pairs] == [(c[1], c[2]) for c in connections]
+
+
+def test_make_shortest_connections_spatial(junction_boxes):
+    circuits, connections = make_shortest_connections_spatial(junction_boxes, 10)
+    _, expected = make_shortest_connections(calculate_distances(junction_boxes), 10)
+
+    assert connections == expected
+    assert count_circuit_sizes(circuits, 3) == 40
+
+
+def test_make_shortest_connections_spatial_outlier():
+    # One box far away from the cluster must not make the first connections look at every pair
+    rng = random.Random(8)
+    junction_boxes = [JunctionBox(10**7, 10**7, 10**7)]
+    junction_boxes.extend(
+        JunctionBox(rng.randrange(1000), rng.randrange(1000), rng.randrange(1000)) for _ in range(400)
+    )
+    pair_count = len(junction_boxes) * (len(junction_boxes) - 1) // 2
+
+    tree = JunctionBoxTree(junction_boxes)
+    pairs = list(islice(generate_nearest_pairs(junction_boxes, tree), len(junction_boxes)))
+    _, connections = make_shortest_connections_spatial(junction_boxes, len(junction_boxes))
+    _, expected = make_shortest_connections(calculate_distances(junction_boxes), len(junction_boxes))
+
+    assert [to_connection(junction_boxes, pair) for pair in pairs] == expected
+    assert connections == expected
+    assert tree.distance_evaluations < pair_count // 5
+
+
+def test_find_spanning_tree_spatial(junction_boxes):
+    _, spanning_tree = find_spanning_tree_spatial(junction_boxes)
+
+    assert len(spanning_tree) == len(junction_boxes) - 1
+    assert phase2(spanning_tree) == 25272
+
+
+def test_find_spanning_tree_spatial_outlier():
+    # One box far away from the cluster must not make the search look at almost every pair
+    rng = random.Random(8)
+    junction_boxes = [JunctionBox(rng.randrange(1000), rng.randrange(1000), rng.randrange(1000)) for _ in range(400)]
+    junction_boxes.append(JunctionBox(10**7, 10**7, 10**7))
+    pair_count = len(junction_boxes) * (len(junction_boxes) - 1) // 2
+
+    tree = JunctionBoxTree(junction_boxes)
+    pairs = find_spanning_pairs(junction_boxes, tree)
+    _, spanning_tree = find_spanning_tree_spatial(junction_boxes)
+    _, expected = find_spanning_tree(junction_boxes, calculate_distances(junction_boxes))
+
+    assert len(pairs) == len(junction_boxes) - 1
+    assert spanning_tree == expected
+    assert tree.distance_evaluations < pair_count // 3
+
+
+def test_find_spanning_tree_spatial_ties():
+    # On a lattice most distances are tied, the tree has to match the sorted order
+    junction_boxes = [
+        JunctionBox(x * 10, y * 10, z * 10) for x in range(0, 5) for y in range(0, 5) for z in range(0, 5)
+    ]
+    junction_boxes.append(JunctionBox(10**7, 10**7, 10**7))
+
+    _, spanning_tree = find_spanning_tree_spatial(junction_boxes)
+    _, expected = find_spanning_tree(junction_boxes, calculate_distances(junction_boxes))
+
+    assert spanning_tree == expected
+
+
+def test_sorted_connections(junction_boxes):
+    connections = calculate_distances(junction_boxes)
+    sorted_connections = SortedConnections(connections)
+
+    assert sorted_connections[3] == sorted(connections)[3]
+    assert list(sorted_connections) == sorted(connections)
+    assert len(sorted_connections) == len(connections)
+
+
+def test_sorted_connections_shared(junction_boxes):
+    sorted_connections = SortedConnections(calculate_distances(junction_boxes))
+
+    circuits, _ = make_shortest_connections(sorted_connections, 10)
+    assert count_circuit_sizes(circuits, 3) == 40
+
+    _, spanning_tree = find_spanning_tree(junction_boxes, sorted_connections)
+    assert phase2(spanning_tree) == 25272
+
+
+@pytest.mark.parametrize("block_size", [1, 3, None])
+def test_find_nearest_pairs_numpy(junction_boxes, block_size):
+    pytest.importorskip("numpy")
+
+    pairs = find_nearest_pairs_numpy(junction_boxes, 25, block_size)
+
+    assert pairs == list(generate_nearest_pairs(junction_boxes))[:25]
+
+
+def test_make_shortest_connections_numpy(junction_boxes):
+    pytest.importorskip("numpy")
+
+    circuits, connections = make_shortest_connections_numpy(junction_boxes, 10)
+    _, expected = make_shortest_connections(calculate_distances(junction_boxes), 10)
+
+    assert connections == expected
+    assert count_circuit_sizes(circuits, 3) == 40
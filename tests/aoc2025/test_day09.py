@@ -0,0 +1,128 @@
+import pytest
+import tracemalloc
+from pathlib import Path
+
+from aoc2025.day09 import (
+    CompressedPolygon,
+    Point,
+    Polygon,
+    find_biggest_rect_pruned,
+    get_biggest_rect,
+    get_biggest_rect_2,
+    read_file,
+)
+
+
+TEST_FILE = Path(__file__).parent / "data" / "day09.txt"
+
+
+@pytest.fixture
+def red_tiles() -> list[Point]:
+    return read_file(TEST_FILE)
+
+
+def rectangle(tile1: Point, tile2: Point) -> tuple[Point, ...]:
+    return (tile1, Point(tile1.x, tile2.y), tile2, Point(tile2.x, tile1.y))
+
+
+def test_read_file(red_tiles):
+    assert red_tiles[0] == Point(7, 1)
+    assert len(red_tiles) == 8
+
+
+def test_get_biggest_rect(red_tiles):
+    assert get_biggest_rect(red_tiles) == 50
+
+
+def test_get_biggest_rect_2(red_tiles):
+    assert get_biggest_rect_2(red_tiles, Polygon(red_tiles)) == 24
+    assert get_biggest_rect_2(red_tiles, CompressedPolygon(red_tiles)) == 24
+
+
+def test_find_biggest_rect_pruned_staircase():
+    # The biggest rectangles of the bounding box all cut through the steps
+    red_tiles = [Point(0, 0)]
+    for step in range(0, 50):
+        red_tiles.extend((Point(step * 10, (50 - step) * 10), Point(step * 10 + 10, (50 - step) * 10)))
+    red_tiles.append(Point(500, 0))
+    polygon = CompressedPolygon(red_tiles)
+    pair_count = len(red_tiles) * (len(red_tiles) - 1) // 2
+
+    tracemalloc.start()
+    try:
+        size, examined = find_biggest_rect_pruned(red_tiles, polygon)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert size == get_biggest_rect_2(red_tiles, polygon)
+    assert examined < pair_count // 2
+    # Holding all pairs at once would take thousands of bytes per tile here
+    assert peak < 1000 * len(red_tiles)
+
+
+@pytest.mark.parametrize("tile1,tile2,expected",
+                         [
+                                (Point(9, 5), Point(2, 3), True),
+                                (Point(9, 7), Point(11, 1), True),
+                                (Point(7, 3), Point(11, 1), True),
+                                (Point(2, 5), Point(11, 1), False),
+                                (Point(7, 1), Point(2, 3), False),
+                                (Point(9, 7), Point(2, 5), False),
+                         ])
+def test_compressed_polygon_is_rectangle_inside(red_tiles, tile1, tile2, expected):
+    polygon = CompressedPolygon(red_tiles)
+    assert polygon.is_rectangle_inside(rectangle(tile1, tile2)) == expected
+
+
+def test_compressed_polygon_notch():
+    # U shape whose notch is only one tile wide: x=3 between y=0 and y=2 is outside
+    corners = [Point(0, 0), Point(2, 0), Point(2, 2), Point(4, 2), Point(4, 0), Point(6, 0), Point(6, 4), Point(0, 4)]
+    polygon = CompressedPolygon(corners)
+
+    assert not polygon.is_rectangle_inside(rectangle(Point(0, 0), Point(6, 4)))
+    assert not polygon.is_rectangle_inside(rectangle(Point(2, 0), Point(4, 2)))
+    assert polygon.is_rectangle_inside(rectangle(Point(2, 2), Point(6, 4)))
+    assert polygon.is_rectangle_inside(rectangle(Point(0, 0), Point(2, 4)))
+
+
+def test_polygon_corners_sharing_x():
+    # Comb whose teeth put four corners on x=4 and six on x=6
+    corners = [
+        Point(0, 0), Point(6, 0), Point(6, 2), Point(4, 2), Point(4, 4), Point(6, 4),
+        Point(6, 6), Point(4, 6), Point(4, 8), Point(6, 8), Point(6, 10), Point(0, 10),
+    ]
+    polygon = Polygon(corners)
+
+    assert polygon.is_rectangle_inside(rectangle(Point(0, 0), Point(4, 10)))
+    assert polygon.is_rectangle_inside(rectangle(Point(2, 4), Point(6, 6)))
+    assert not polygon.is_rectangle_inside(rectangle(Point(0, 0), Point(6, 10)))
+    assert not polygon.is_rectangle_inside(rectangle(Point(2, 3), Point(6, 5)))
+    assert not polygon.is_rectangle_inside(rectangle(Point(2, 1), Point(5, 9)))
+
+
+def test_find_biggest_rect_pruned(red_tiles):
+    size, examined = find_biggest_rect_pruned(red_tiles, CompressedPolygon(red_tiles))
+
+    assert size == 24
+    assert 0 < examined <= len(red_tiles) * (len(red_tiles) - 1) // 2
+
+
+def test_find_biggest_rect_pruned_no_polygon_constraint(red_tiles):
+    polygon = Polygon([Point(0, 0), Point(20, 0), Point(20, 20), Point(0, 20)])
+    size, examined = find_biggest_rect_pruned(red_tiles, polygon)
+
+    assert size == get_biggest_rect(red_tiles)
+    assert examined == 1
+
+
+@pytest.mark.parametrize("tile1,tile2,expected",
+                         [
+                                (Point(9, 5), Point(2, 3), True),
+                                (Point(2, 5), Point(11, 1), False),
+                                (Point(11, 7), Point(2, 5), False),
+                                (Point(7, 1), Point(11, 5), True),
+                         ])
+def test_polygon_is_rectangle_inside(red_tiles, tile1, tile2, expected):
+    polygon = Polygon(red_tiles)
+    assert polygon.is_rectangle_inside(rectangle(tile1, tile2)) == expected
@@ -0,0 +1,71 @@
+import pytest
+from pathlib import Path
+
+from aoc2025.day10 import (
+    Machine,
+    button_to_mask,
+    find_initialization_procedure,
+    find_initialization_procedure_bitmask,
+    find_initialization_procedure_gf2,
+    find_joltage_configuration,
+    lights_to_mask,
+    read_file,
+    run_joltage_configuration,
+)
+
+
+TEST_FILE = Path(__file__).parent / "data" / "day10.txt"
+
+INITIALIZATION_SOLVERS = [
+    find_initialization_procedure,
+    find_initialization_procedure_bitmask,
+    find_initialization_procedure_gf2,
+]
+
+
+@pytest.fixture
+def machines() -> list[Machine]:
+    return read_file(TEST_FILE)
+
+
+def test_read_file(machines):
+    assert len(machines) == 3
+    assert machines[0] == Machine(
+        (False, True, True, False), [(3,), (1, 3), (2,), (2, 3), (0, 2), (0, 1)], (3, 5, 4, 7)
+    )
+
+
+def test_masks():
+    assert lights_to_mask((False, True, True, False)) == 0b0110
+    assert button_to_mask((0, 2, 3)) == 0b1101
+
+
+@pytest.mark.parametrize("solver", INITIALIZATION_SOLVERS)
+def test_find_initialization_procedure(machines, solver):
+    assert [solver(machine) for machine in machines] == [2, 3, 2]
+
+
+def test_initialization_solvers_agree():
+    buttons = [(0, 1), (1, 2), (2, 3), (3, 4), (0, 4), (0, 2), (1, 3)]
+    for target in range(1, 1 << 5):
+        lights = tuple(bool(target >> i & 1) for i in range(0, 5))
+        machine = Machine(lights, buttons, ())
+        expected = find_initialization_procedure_bitmask(machine)
+        assert find_initialization_procedure(machine) == expected
+        assert find_initialization_procedure_gf2(machine) == expected
+
+
+def test_find_initialization_procedure_unreachable():
+    machine = Machine((True, False, False), [(1,), (1, 2)], ())
+
+    assert find_initialization_procedure_bitmask(machine) == -1
+    assert find_initialization_procedure_gf2(machine) == -1
+
+
+def test_find_joltage_configuration(machines):
+    assert [find_joltage_configuration(machine) for machine in machines] == [10, 12, 11]
+
+
+def test_find_joltage_configuration_parallel(machines):
+    assert [find_joltage_configuration(machine, processes=2) for machine in machines] == [10, 12, 11]
+    assert run_joltage_configuration(machines, parallel_tree=True) == 33
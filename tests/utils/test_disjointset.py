@@ -0,0 +1,143 @@
+import pytest
+import random
+
+from utils.disjointset import DisjointSet, IntDisjointSet
+
+
+@pytest.fixture
+def int_disjoint_set() -> IntDisjointSet:
+    disjoint_set = IntDisjointSet(8)
+    disjoint_set.union(0, 1)
+    disjoint_set.union(2, 3)
+    disjoint_set.union(1, 3)
+    disjoint_set.union(5, 6)
+    return disjoint_set
+
+
+def test_int_disjoint_set_find(int_disjoint_set):
+    assert int_disjoint_set.find(0) == int_disjoint_set.find(3)
+    assert int_disjoint_set.find(5) == int_disjoint_set.find(6)
+    assert int_disjoint_set.find(4) == 4
+    assert int_disjoint_set.find(0) != int_disjoint_set.find(5)
+
+
+def test_int_disjoint_set_sizes(int_disjoint_set):
+    assert len(int_disjoint_set) == 8
+    assert int_disjoint_set.component_count == 4
+    assert int_disjoint_set.size(2) == 4
+    assert int_disjoint_set.largest_sizes(3) == [4, 2, 1]
+    assert sorted(size for _, size in int_disjoint_set.values()) == [1, 1, 2, 4]
+
+
+def test_int_disjoint_set_union(int_disjoint_set):
+    root, size = int_disjoint_set.union(7, 0)
+    assert root == int_disjoint_set.find(0)
+    assert size == 5
+
+    root, size = int_disjoint_set.union(7, 3)
+    assert size == 5
+    assert int_disjoint_set.component_count == 3
+
+
+def test_int_disjoint_set_long_chain():
+    n = 100000
+    disjoint_set = IntDisjointSet(n)
+    for i in range(1, n):
+        disjoint_set._parents[i] = i - 1
+    disjoint_set._roots = {0}
+
+    assert disjoint_set.find(n - 1) == 0
+
+
+def test_int_disjoint_set_add():
+    disjoint_set = IntDisjointSet()
+    a = disjoint_set.add()
+    b = disjoint_set.add()
+
+    assert (a, b) == (0, 1)
+    assert disjoint_set.union(a, b) == (0, 2)
+    assert disjoint_set.component_count == 1
+
+
+def test_disjoint_set():
+    disjoint_set = DisjointSet[str]()
+    disjoint_set.union("a", "b")
+    disjoint_set.union("c", "d")
+    root, size = disjoint_set.union("b", "d")
+
+    assert size == 4
+    assert disjoint_set.find("c") == root
+    assert disjoint_set.find("e") == "e"
+    assert "e" in disjoint_set
+    assert "f" not in disjoint_set
+    assert disjoint_set.component_count == 2
+    assert disjoint_set.values() == {(root, 4), ("e", 1)}
+    assert disjoint_set.largest_sizes(2) == [4, 1]
+
+
+def test_int_disjoint_set_union_many():
+    disjoint_set = IntDisjointSet(6)
+    merged = disjoint_set.union_many([(0, 1), (1, 2), (2, 0), (3, 4)])
+
+    assert merged == 3
+    assert disjoint_set.component_count == 3
+    assert disjoint_set.largest_sizes(2) == [3, 2]
+
+
+@pytest.mark.parametrize("rollback", [False, True])
+def test_int_disjoint_set_union_many_matches_union(rollback):
+    rng = random.Random(14)
+    pairs = [(rng.randrange(200), rng.randrange(200)) for _ in range(300)]
+    bulk = IntDisjointSet(200, rollback=rollback)
+    single = IntDisjointSet(200, rollback=rollback)
+
+    merged = bulk.union_many(pairs)
+    for a, b in pairs:
+        single.union(a, b)
+
+    assert merged == 200 - single.component_count
+    assert bulk.values() == single.values()
+    assert all(bulk.find(a) == bulk.find(b) for a, b in pairs)
+
+
+def test_int_disjoint_set_rollback():
+    disjoint_set = IntDisjointSet(6, rollback=True)
+    disjoint_set.union(0, 1)
+
+    disjoint_set.checkpoint()
+    disjoint_set.union_many([(1, 2), (3, 4)])
+
+    disjoint_set.checkpoint()
+    disjoint_set.union(2, 4)
+    assert disjoint_set.component_count == 2
+    assert disjoint_set.size(0) == 5
+
+    disjoint_set.rollback()
+    assert disjoint_set.component_count == 3
+    assert disjoint_set.size(0) == 3
+    assert disjoint_set.find(4) == disjoint_set.find(3)
+
+    disjoint_set.rollback()
+    assert disjoint_set.component_count == 5
+    assert disjoint_set.values() == {(disjoint_set.find(0), 2), (2, 1), (3, 1), (4, 1), (5, 1)}
+
+    with pytest.raises(ValueError):
+        disjoint_set.rollback()
+
+
+def test_int_disjoint_set_checkpoint_needs_rollback_mode():
+    with pytest.raises(ValueError):
+        IntDisjointSet(2).checkpoint()
+
+
+def test_disjoint_set_rollback():
+    disjoint_set = DisjointSet[str](rollback=True)
+    disjoint_set.union_many([("a", "b"), ("c", "d")])
+
+    disjoint_set.checkpoint()
+    _, size = disjoint_set.union("a", "d")
+    assert size == 4
+
+    disjoint_set.rollback()
+    assert disjoint_set.largest_sizes(3) == [2, 2]
+    assert disjoint_set.find("a") != disjoint_set.find("d")
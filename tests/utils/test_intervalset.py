@@ -0,0 +1,59 @@
+import pytest
+
+from utils.intervalset import IntervalSet
+
+
+@pytest.fixture
+def interval_set() -> IntervalSet:
+    return IntervalSet([(3, 5), (10, 14), (16, 20), (12, 18)])
+
+
+def test_add(interval_set):
+    assert list(interval_set) == [(3, 5), (10, 20)]
+    assert interval_set.total == 14
+
+
+@pytest.mark.parametrize("start,end,expected,total",
+                         [
+                                (6, 9, [(3, 20)], 18),
+                                (7, 8, [(3, 5), (7, 8), (10, 20)], 16),
+                                (0, 1, [(0, 1), (3, 5), (10, 20)], 16),
+                                (21, 30, [(3, 5), (10, 30)], 24),
+                                (4, 12, [(3, 20)], 18),
+                                (0, 100, [(0, 100)], 101),
+                                (11, 15, [(3, 5), (10, 20)], 14),
+                         ])
+def test_add_coalesces(interval_set, start, end, expected, total):
+    interval_set.add(start, end)
+
+    assert list(interval_set) == expected
+    assert interval_set.total == total
+
+
+@pytest.mark.parametrize("start,end,expected,total",
+                         [
+                                (12, 14, [(3, 5), (10, 11), (15, 20)], 11),
+                                (0, 3, [(4, 5), (10, 20)], 13),
+                                (5, 10, [(3, 4), (11, 20)], 12),
+                                (6, 9, [(3, 5), (10, 20)], 14),
+                                (0, 100, [], 0),
+                                (10, 20, [(3, 5)], 3),
+                         ])
+def test_remove(interval_set, start, end, expected, total):
+    interval_set.remove(start, end)
+
+    assert list(interval_set) == expected
+    assert interval_set.total == total
+
+
+@pytest.mark.parametrize("value,expected",
+                         [
+                                (2, False),
+                                (3, True),
+                                (5, True),
+                                (6, False),
+                                (17, True),
+                                (21, False),
+                         ])
+def test_contains(interval_set, value, expected):
+    assert (value in interval_set) == expected
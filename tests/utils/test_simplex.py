@@ -0,0 +1,292 @@
+import pytest
+from fractions import Fraction
+
+from utils.simplex import (
+    BoundedSimplexTableau,
+    BranchAndBoundNodes,
+    NodeSelection,
+    PARALLEL_SUBPROBLEMS,
+    RevisedSimplex,
+    Simplex,
+    SimplexBackend,
+    SimplexConstraint,
+    SimplexConstraintType,
+    SimplexStandardForm,
+    SimplexTableau,
+    SparseStandardForm,
+)
+
+
+def requires_backend(backend: SimplexBackend) -> None:
+    if backend == SimplexBackend.NUMPY:
+        pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def simplex() -> Simplex:
+    # max 3x + 5y, x <= 4, 2y <= 12, 3x + 2y <= 18
+    simplex = Simplex((3, 5))
+    simplex.addLEqConsraint([1, 0], 4)
+    simplex.addLEqConsraint([0, 2], 12)
+    simplex.addLEqConsraint([3, 2], 18)
+    return simplex
+
+
+@pytest.fixture
+def joltage_simplex() -> Simplex:
+    # First machine of the day 10 example, minimising the button presses
+    buttons = [(3,), (1, 3), (2,), (2, 3), (0, 2), (0, 1)]
+    joltages = (3, 5, 4, 7)
+
+    simplex = Simplex(tuple([-1] * len(buttons)))
+    for i, requirement in enumerate(joltages):
+        simplex.addEqConsraint([int(i in b) for b in buttons], requirement)
+    return simplex
+
+
+@pytest.mark.parametrize("backend", [SimplexBackend.FRACTION, SimplexBackend.NUMPY, SimplexBackend.REVISED])
+def test_solve(simplex, backend):
+    requires_backend(backend)
+
+    optimal_value, variables = simplex.solve(backend)
+
+    assert optimal_value == 36
+    assert variables == (2, 6)
+
+
+@pytest.mark.parametrize("backend", [SimplexBackend.FRACTION, SimplexBackend.NUMPY, SimplexBackend.REVISED])
+def test_solve_fractional(backend):
+    requires_backend(backend)
+
+    # max x + y, 2x + y <= 4, x + 2y <= 3
+    simplex = Simplex((1, 1))
+    simplex.addLEqConsraint([2, 1], 4)
+    simplex.addLEqConsraint([1, 2], 3)
+
+    optimal_value, variables = simplex.solve(backend)
+
+    assert optimal_value == Fraction(7, 3)
+    assert variables == (Fraction(5, 3), Fraction(2, 3))
+
+
+@pytest.mark.parametrize("backend", [SimplexBackend.FRACTION, SimplexBackend.NUMPY, SimplexBackend.REVISED])
+def test_solve_integer(joltage_simplex, backend):
+    requires_backend(backend)
+
+    optimal_value, variables = joltage_simplex.solve_integer(backend)
+
+    assert optimal_value == -10
+    assert all(x.is_integer() for x in variables)
+
+
+def test_solve_integer_warm_start_options_need_fraction(joltage_simplex):
+    with pytest.raises(ValueError):
+        joltage_simplex.solve_integer(SimplexBackend.REVISED, node_selection=NodeSelection.BEST_BOUND)
+    with pytest.raises(ValueError):
+        joltage_simplex.solve_integer(SimplexBackend.REVISED, gomory_cuts=1)
+
+
+def test_solve_numpy_infeasible():
+    pytest.importorskip("numpy")
+
+    simplex = Simplex((1, 1))
+    simplex.addLEqConsraint([1, 1], 2)
+    simplex.addGEqConsraint([1, 1], 3)
+
+    assert simplex.solve(SimplexBackend.NUMPY) is None
+
+
+def test_standard_form_verify_basis():
+    constraints = [
+        SimplexConstraint(SimplexConstraintType.LEQ, (1, 0), 4),
+        SimplexConstraint(SimplexConstraintType.LEQ, (0, 2), 12),
+        SimplexConstraint(SimplexConstraintType.LEQ, (3, 2), 18),
+    ]
+    standard_form = SimplexStandardForm.build((3, 5), constraints)
+
+    # x, y and the slack of the first row are basic at the optimum
+    assert standard_form.verify_basis([2, 1, 0]) == (36, (2, 6))
+    # The slack basis is feasible but not optimal
+    assert standard_form.verify_basis([2, 3, 4]) is None
+    # x = 4, y = 6 violates the third row
+    assert standard_form.verify_basis([0, 1, 4]) is None
+
+
+@pytest.mark.parametrize("backend", [SimplexBackend.FRACTION, SimplexBackend.REVISED])
+def test_solve_infeasible(backend):
+    simplex = Simplex((1, 1))
+    simplex.addLEqConsraint([1, 1], 2)
+    simplex.addGEqConsraint([1, 1], 3)
+
+    assert simplex.solve(backend) is None
+
+
+@pytest.mark.parametrize("backend", [SimplexBackend.FRACTION, SimplexBackend.REVISED])
+def test_solve_negative_rhs(backend):
+    # max -x - y, -x - y <= -3, x <= 2
+    simplex = Simplex((-1, -1))
+    simplex.addLEqConsraint([-1, -1], -3)
+    simplex.addLEqConsraint([1, 0], 2)
+
+    optimal_value, variables = simplex.solve(backend)
+
+    assert optimal_value == -3
+    assert sum(variables) == 3
+
+
+def test_sparse_standard_form():
+    constraints = [
+        SimplexConstraint(SimplexConstraintType.LEQ, (1, 0), 4),
+        SimplexConstraint(SimplexConstraintType.GEQ, (0, 2), 1),
+        SimplexConstraint(SimplexConstraintType.EQ, (3, 2), 18),
+    ]
+    standard_form = SparseStandardForm.build((3, 5), constraints)
+
+    assert standard_form.columns == [[(0, 1), (2, 3)], [(1, 2), (2, 2)], [(0, 1)], [(1, -1)], [(1, 1)], [(2, 1)]]
+    assert standard_form.artificials == [4, 5]
+    assert standard_form.initial_basis == [2, 4, 5]
+
+
+def test_revised_simplex_refactor(joltage_simplex):
+    # Refactoring after every pivot must not change the optimum
+    standard_form = SparseStandardForm.build(joltage_simplex.profit, joltage_simplex.constraints)
+    revised = RevisedSimplex(standard_form, refactor_interval=1)
+
+    optimal_value, _ = revised.solve()
+
+    assert optimal_value == joltage_simplex.solve(SimplexBackend.REVISED)[0]
+    assert revised.pivot_count > 0
+
+
+def test_tableau_drop_artificials(joltage_simplex):
+    tableau = SimplexTableau(joltage_simplex.profit, joltage_simplex.constraints)
+    assert tableau.artificial_count == 4
+    # Phase I starts with every artificial at its row's requirement
+    assert tableau.zj.rhs == -(3 + 5 + 4 + 7)
+
+    while True:
+        column = max(range(0, len(tableau.net_evaluation)), key=lambda i: tableau.net_evaluation[i])
+        if tableau.net_evaluation[column] <= 0:
+            break
+        rows = [(row.rhs / row.lhs[column], i) for i, row in enumerate(tableau.rows) if row.lhs[column] > 0]
+        tableau.pivot(min(rows)[1], column)
+
+    assert tableau.drop_artificials()
+    assert tableau.artificial_count == 0
+    assert all(len(row.lhs) == len(joltage_simplex.profit) for row in tableau.rows)
+    assert tableau.zj == tableau.recompute_zj()
+
+
+def test_solve_integer_warm_start(joltage_simplex):
+    optimal_value, variables = joltage_simplex.solve_integer()
+
+    assert optimal_value == -10
+    assert all(x.is_integer() for x in variables)
+
+
+def test_solve_integer_warm_start_infeasible():
+    # 2x + 2y = 3 has fractional solutions only
+    simplex = Simplex((1, 1))
+    simplex.addEqConsraint([2, 2], 3)
+
+    assert simplex.solve() is not None
+    assert simplex.solve_integer() is None
+
+
+def test_bounded_tableau_reoptimize():
+    # max x + y, 2x + y <= 4, x + 2y <= 3 has its optimum at x = 5/3, y = 2/3
+    constraints = [
+        SimplexConstraint(SimplexConstraintType.LEQ, (2, 1), 4),
+        SimplexConstraint(SimplexConstraintType.LEQ, (1, 2), 3),
+    ]
+    tableau = BoundedSimplexTableau(SimplexStandardForm.build((1, 1), constraints))
+    assert tableau.solve()
+
+    floor_child = tableau.copy()
+    floor_child.set_upper_bound(0, 1)
+    assert floor_child.reoptimize()
+    assert floor_child.get_solution() == (2, (1, 1))
+
+    tableau.set_lower_bound(0, 2)
+    assert tableau.reoptimize()
+    assert tableau.get_solution() == (2, (2, 0))
+
+    # Conflicting bounds on y leave nothing feasible
+    tableau.set_upper_bound(1, 0)
+    tableau.set_lower_bound(1, 1)
+    assert not tableau.reoptimize()
+
+
+@pytest.mark.parametrize("node_selection", list(NodeSelection))
+@pytest.mark.parametrize("gomory_cuts", [0, 2])
+def test_solve_integer_node_selection(joltage_simplex, node_selection, gomory_cuts):
+    optimal_value, variables = joltage_simplex.solve_integer(node_selection=node_selection, gomory_cuts=gomory_cuts)
+
+    assert optimal_value == -10
+    assert all(x.is_integer() for x in variables)
+    assert joltage_simplex.stats.nodes >= 1
+    assert joltage_simplex.stats.incumbents >= 1
+    assert joltage_simplex.stats.cuts <= gomory_cuts
+
+
+def test_bounded_tableau_gomory_cut():
+    # max x + y, 2x + y <= 4, x + 2y <= 3 has its optimum at x = 5/3, y = 2/3
+    constraints = [
+        SimplexConstraint(SimplexConstraintType.LEQ, (2, 1), 4),
+        SimplexConstraint(SimplexConstraintType.LEQ, (1, 2), 3),
+    ]
+    tableau = BoundedSimplexTableau(SimplexStandardForm.build((1, 1), constraints))
+    assert tableau.solve()
+
+    assert tableau.add_gomory_cut()
+    assert tableau.reoptimize()
+    optimal_value, _ = tableau.get_solution()
+    # The cut removes the fractional optimum but keeps the integer optimum of 2
+    assert 2 <= optimal_value < Fraction(7, 3)
+
+
+def test_branch_and_bound_nodes():
+    depth_first = BranchAndBoundNodes(best_bound=False)
+    best_bound = BranchAndBoundNodes(best_bound=True)
+    for bound, node in [(Fraction(3), "a"), (Fraction(5), "b"), (Fraction(1), "c"), (Fraction(5), "d")]:
+        depth_first.push(bound, node)
+        best_bound.push(bound, node)
+
+    assert [depth_first.pop()[1] for _ in range(0, 2)] == ["d", "c"]
+    assert [best_bound.pop()[1] for _ in range(0, 4)] == ["d", "b", "a", "c"]
+
+    depth_first.use_best_bound()
+    assert [depth_first.pop() for _ in range(0, len(depth_first))] == [(5, "b"), (3, "a")]
+
+
+def test_solve_integer_parallel():
+    # A machine with a search tree of about a thousand nodes, big enough to be split over the pool
+    buttons = [
+        (2, 6, 8), (0, 2, 7, 9), (0, 1, 3, 4, 6), (0, 1, 2, 5), (2, 7), (0, 2, 3, 5, 9), (6, 7),
+        (0, 2, 7), (8, 9), (2, 5, 6), (1, 5, 8), (2, 5, 6), (2, 3, 6, 9),
+    ]
+    joltages = (120, 79, 254, 32, 11, 161, 135, 139, 77, 64)
+    simplex = Simplex(tuple([-1] * len(buttons)))
+    for i, requirement in enumerate(joltages):
+        simplex.addEqConsraint([int(i in b) for b in buttons], requirement)
+
+    serial_value, _ = simplex.solve_integer(node_selection=NodeSelection.BEST_BOUND)
+    parallel_result = simplex.solve_integer(node_selection=NodeSelection.BEST_BOUND, processes=2)
+
+    assert parallel_result[0] == serial_value == -340
+    assert simplex.stats.nodes > PARALLEL_SUBPROBLEMS
+    # The same subproblems are solved whatever the process count or timing
+    assert simplex.solve_integer(node_selection=NodeSelection.BEST_BOUND, processes=3) == parallel_result
+
+
+def test_revised_simplex_refactor_interval():
+    # The basis ends up with more structural columns than the interval, a refactor
+    # must still only happen once per interval pivots
+    rows = [[int(j in (i, (i + 1) % 8)) for j in range(0, 8)] for i in range(0, 8)]
+    constraints = [SimplexConstraint(SimplexConstraintType.EQ, tuple(row), 2 * sum(row)) for row in rows]
+    revised = RevisedSimplex(SparseStandardForm.build(tuple([-1] * 8), constraints), refactor_interval=2)
+
+    optimal_value, _ = revised.solve()
+
+    assert optimal_value == -16
+    assert revised.refactor_count <= revised.pivot_count // 3